@@ -2,6 +2,7 @@
 
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 from dotenv import load_dotenv
 
@@ -128,6 +129,13 @@ class GameConfig:
     unicode_pieces: bool = True
 
 
+@lru_cache(maxsize=1)
 def get_config() -> GameConfig:
-    """Get the default game configuration."""
+    """Get the game configuration, built once from env vars and saved credentials."""
     return GameConfig()
+
+
+def reload_config() -> GameConfig:
+    """Rebuild the game configuration after saved credentials change."""
+    get_config.cache_clear()
+    return get_config()
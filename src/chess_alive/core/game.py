@@ -32,7 +32,7 @@ class GameState(Enum):
     FINISHED = auto()  # Game over
 
 
-@dataclass
+@dataclass(slots=True)
 class MoveRecord:
     """Record of a single move with metadata."""
 
@@ -1,11 +1,17 @@
 """LLM API client supporting OpenRouter and Ollama (OpenAI-compatible)."""
 
-from dataclasses import dataclass
-from typing import Optional, AsyncIterator
+import asyncio
+import importlib.util
+import json
+from dataclasses import dataclass, replace
+from typing import Optional, AsyncGenerator
 import httpx
 
 from ..config import LLMConfig
 
+# HTTP/2 lets concurrent requests share one connection; httpx needs h2 for it
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
 
 @dataclass
 class LLMResponse:
@@ -30,9 +36,14 @@ class LLMClient:
         """
         self.config = config or LLMConfig()
         self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create the HTTP client."""
+        loop = asyncio.get_running_loop()
+        # Connections opened under a previous event loop can't be reused
+        if self._client is not None and self._loop is not loop:
+            await self.close()
         if self._client is None or self._client.is_closed:
             headers: dict[str, str] = {
                 "Content-Type": "application/json",
@@ -47,7 +58,9 @@ class LLMClient:
                 base_url=self.config.base_url,
                 headers=headers,
                 timeout=120.0,  # Ollama local inference can be slow
+                http2=_HTTP2,
             )
+            self._loop = loop
         return self._client
 
     async def complete(
@@ -130,14 +143,7 @@ class LLMClient:
             )
 
         except httpx.HTTPStatusError as e:
-            error_detail = ""
-            try:
-                error_data = e.response.json()
-                error_detail = error_data.get("error", {}).get("message", str(e))
-            except Exception:
-                error_detail = str(e)
-            provider = self.config.provider_display
-            raise LLMError(f"{provider} API error: {error_detail}") from e
+            raise self._api_error(e) from e
 
         except httpx.ConnectError as e:
             if self.config.is_ollama:
@@ -157,7 +163,7 @@ class LLMClient:
         model: Optional[str] = None,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
-    ) -> AsyncIterator[str]:
+    ) -> AsyncGenerator[str, None]:
         """
         Stream completion from the LLM.
 
@@ -187,6 +193,9 @@ class LLMClient:
 
         try:
             async with client.stream("POST", "/chat/completions", json=payload) as response:
+                if response.is_error:
+                    # Read the body so the provider's error message can be reported
+                    await response.aread()
                 response.raise_for_status()
                 async for line in response.aiter_lines():
                     if line.startswith("data: "):
@@ -194,7 +203,6 @@ class LLMClient:
                         if data_str.strip() == "[DONE]":
                             break
                         try:
-                            import json
                             data = json.loads(data_str)
                             delta = data["choices"][0].get("delta", {})
                             content = delta.get("content", "")
@@ -204,13 +212,42 @@ class LLMClient:
                             continue
 
         except httpx.HTTPStatusError as e:
-            raise LLMError(f"{self.config.provider_display} API error: {e}") from e
+            raise self._api_error(e) from e
+
+        except httpx.ConnectError as e:
+            if self.config.is_ollama:
+                raise LLMError(
+                    "Cannot connect to Ollama. Is it running? "
+                    "Start it with: ollama serve"
+                ) from e
+            raise LLMError(f"Connection failed: {e}") from e
+
+        except httpx.RequestError as e:
+            raise LLMError(f"Request failed: {e}") from e
+
+    def _api_error(self, e: httpx.HTTPStatusError) -> "LLMError":
+        """Build an LLMError carrying the provider's message from an error response."""
+        try:
+            error_data = e.response.json()
+            error_detail = error_data.get("error", {}).get("message", str(e))
+        except Exception:
+            error_detail = str(e)
+        return LLMError(f"{self.config.provider_display} API error: {error_detail}")
 
     async def close(self):
-        """Close the HTTP client."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """Close the HTTP client on the event loop that created it."""
+        client, loop = self._client, self._loop
+        self._client = None
+        self._loop = None
+        if client is None or loop is None:
+            return
+        if loop is asyncio.get_running_loop():
+            await client.aclose()
+        elif loop.is_running():
+            # Owned by a loop in another thread; close it there
+            closing = asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            await asyncio.wrap_future(closing)
+        # Otherwise the owning loop has finished and the client is simply dropped
 
     async def __aenter__(self):
         return self
@@ -225,6 +262,34 @@ class LLMError(Exception):
     pass
 
 
+_shared_client: Optional[LLMClient] = None
+
+
+async def get_shared_client(config: LLMConfig) -> LLMClient:
+    """Get a client for *config* that is reused across matches.
+
+    Sharing keeps the HTTP connection pool warm between games. The
+    client holds a copy of *config*, so editing the original afterwards
+    (e.g. a new API key) closes the old client and gives a fresh one
+    rather than stale headers. The last client stays open until
+    close_shared_clients() is called, which callers must do on exit.
+    """
+    global _shared_client
+    if _shared_client is not None and _shared_client.config == config:
+        return _shared_client
+    await close_shared_clients()
+    _shared_client = LLMClient(replace(config))
+    return _shared_client
+
+
+async def close_shared_clients():
+    """Close the client handed out by get_shared_client."""
+    global _shared_client
+    client, _shared_client = _shared_client, None
+    if client is not None:
+        await client.close()
+
+
 # Convenience function for quick completions
 async def get_completion(
     prompt: str,
@@ -1,15 +1,16 @@
 """LLM-powered commentary system for chess pieces."""
 
+import asyncio
 from dataclasses import dataclass
 from typing import Optional
 import random
 
 from .client import LLMClient, LLMError
 from ..core.game import ChessGame, MoveRecord
-from ..core.piece import Piece, PieceType, Color
+from ..core.piece import Piece, PieceType, Color, PiecePersonality
 
 
-@dataclass
+@dataclass(slots=True)
 class Commentary:
     """A piece of commentary from a chess piece."""
 
@@ -33,9 +34,22 @@ class PieceVoice:
         self.piece = piece
         self.client = client
         self._recent_commentary: list[str] = []
+        # System prompt is rebuilt only when the piece's personality changes
+        self._system_prompt: Optional[str] = None
+        self._prompt_personality: Optional[PiecePersonality] = None
 
     def _get_system_prompt(self) -> str:
         """Get the system prompt for this piece's voice."""
+        if (
+            self._system_prompt is None
+            or self.piece.personality is not self._prompt_personality
+        ):
+            self._prompt_personality = self.piece.personality
+            self._system_prompt = self._build_system_prompt()
+        return self._system_prompt
+
+    def _build_system_prompt(self) -> str:
+        """Build the system prompt from the piece's type, color and personality."""
         personality = self.piece.personality.to_prompt_context()
 
         return f"""You are a {self.piece.piece_type.name_str.lower()} chess piece on the {self.piece.color.name_str.lower()} side.
@@ -214,9 +228,9 @@ class CommentaryEngine:
     def _get_voice(self, piece: Piece) -> PieceVoice:
         """Get or create a voice for a piece."""
         key = (piece.piece_type, piece.color)
-        if key not in self._voices:
-            self._voices[key] = PieceVoice(piece, self.client)
-        voice = self._voices[key]
+        voice = self._voices.get(key)
+        if voice is None:
+            voice = self._voices[key] = PieceVoice(piece, self.client)
         voice.piece = piece  # Update with current piece state
         return voice
 
@@ -256,92 +270,77 @@ class CommentaryEngine:
         if not self.should_generate_commentary(move_record):
             return []
 
-        commentaries = []
-
-        # Commentary from the moving piece
-        moving_piece = move_record.piece
-        voice = self._get_voice(moving_piece)
-        text = await voice.comment_on_move(game, move_record, is_own_move=True)
-        commentaries.append(
-            Commentary(
-                piece=moving_piece,
-                text=text,
-                move_context=move_record,
-                commentary_type="move",
-            )
-        )
-
-        # Commentary from captured piece (if any)
+        # Commentary from the moving piece, the captured piece (if any) and
+        # the checked king (optional) -- each is an independent LLM call
+        speakers: list[tuple[Piece, bool, str]] = [
+            (move_record.piece, True, "move"),
+        ]
         if move_record.captured_piece:
-            captured_voice = self._get_voice(move_record.captured_piece)
-            captured_text = await captured_voice.comment_on_move(
-                game, move_record, is_own_move=False
-            )
-            commentaries.append(
-                Commentary(
-                    piece=move_record.captured_piece,
-                    text=captured_text,
-                    move_context=move_record,
-                    commentary_type="capture",
-                )
-            )
+            speakers.append((move_record.captured_piece, False, "capture"))
 
-        # Reactions from other pieces (optional, limited)
         if include_reactions and (move_record.is_check or move_record.is_checkmate):
             # Get the king that's in check
             opposite_color = move_record.piece.color.opposite
             for piece in game.get_pieces_by_color(opposite_color):
                 if piece.piece_type == PieceType.KING:
-                    king_voice = self._get_voice(piece)
-                    king_text = await king_voice.comment_on_move(
-                        game, move_record, is_own_move=False
-                    )
-                    commentaries.append(
-                        Commentary(
-                            piece=piece,
-                            text=king_text,
-                            move_context=move_record,
-                            commentary_type="reaction",
-                        )
-                    )
+                    speakers.append((piece, False, "reaction"))
                     break
 
+        # Request all lines concurrently so latency is one round-trip, not three
+        texts = await asyncio.gather(*(
+            self._get_voice(piece).comment_on_move(game, move_record, is_own_move=own)
+            for piece, own, _ in speakers
+        ))
+
+        commentaries = [
+            Commentary(
+                piece=piece,
+                text=text,
+                move_context=move_record,
+                commentary_type=commentary_type,
+            )
+            for (piece, _, commentary_type), text in zip(speakers, texts)
+        ]
+
         return commentaries
 
-    async def generate_game_start_commentary(
-        self, game: ChessGame
+    async def _kings_comment(
+        self, game: ChessGame, situation: str, commentary_type: str
     ) -> list[Commentary]:
-        """Generate opening commentary from key pieces."""
-        commentaries = []
-
-        # Let kings make opening statements
+        """Have each side's king comment on a situation, concurrently."""
+        kings: list[Piece] = []
         for color in [Color.WHITE, Color.BLACK]:
             for piece in game.get_pieces_by_color(color):
                 if piece.piece_type == PieceType.KING:
-                    voice = self._get_voice(piece)
-                    text = await voice.comment_on_situation(
-                        game, "The game is about to begin!"
-                    )
-                    commentaries.append(
-                        Commentary(
-                            piece=piece,
-                            text=text,
-                            commentary_type="game_start",
-                        )
-                    )
+                    kings.append(piece)
                     break
 
-        return commentaries
+        texts = await asyncio.gather(*(
+            self._get_voice(king).comment_on_situation(game, situation)
+            for king in kings
+        ))
+
+        return [
+            Commentary(piece=king, text=text, commentary_type=commentary_type)
+            for king, text in zip(kings, texts)
+        ]
+
+    async def generate_game_start_commentary(
+        self, game: ChessGame
+    ) -> list[Commentary]:
+        """Generate opening commentary from key pieces."""
+        # Let kings make opening statements
+        return await self._kings_comment(
+            game, "The game is about to begin!", "game_start"
+        )
 
     async def generate_game_end_commentary(
         self, game: ChessGame
     ) -> list[Commentary]:
         """Generate ending commentary."""
-        commentaries: list[Commentary] = []
-
         result = game.result
         if result == game.result.IN_PROGRESS:
-            return commentaries
+            return []
 
         # Let kings react to the result
         situation = {
@@ -350,18 +349,4 @@ class CommentaryEngine:
             game.result.DRAW: "The game is a draw!",
         }.get(result, "The game has ended.")
 
-        for color in [Color.WHITE, Color.BLACK]:
-            for piece in game.get_pieces_by_color(color):
-                if piece.piece_type == PieceType.KING:
-                    voice = self._get_voice(piece)
-                    text = await voice.comment_on_situation(game, situation)
-                    commentaries.append(
-                        Commentary(
-                            piece=piece,
-                            text=text,
-                            commentary_type="game_end",
-                        )
-                    )
-                    break
-
-        return commentaries
+        return await self._kings_comment(game, situation, "game_end")
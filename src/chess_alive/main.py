@@ -1,18 +1,8 @@
 """Main entry point for ChessAlive."""
 
-import asyncio
-import sys
-from .ui.cli import CLI
+from .ui.cli import main
 
-
-def main():
-    """Main entry point."""
-    cli = CLI()
-    try:
-        asyncio.run(cli.run())
-    except KeyboardInterrupt:
-        print("\nGoodbye!")
-        sys.exit(0)
+__all__ = ["main"]
 
 
 if __name__ == "__main__":
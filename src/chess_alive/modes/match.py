@@ -1,7 +1,8 @@
 """Match orchestration - runs a complete chess game."""
 
+import asyncio
 from dataclasses import dataclass, field
-from typing import Optional, Callable, Awaitable
+from typing import Optional, Callable, Awaitable, Iterable
 from datetime import datetime
 
 from .mode import GameMode
@@ -11,12 +12,19 @@ from ..players.base import Player, PlayerType
 from ..players.human import HumanPlayer
 from ..players.computer import ComputerPlayer
 from ..players.llm_player import LLMPlayer
-from ..llm.client import LLMClient
+from ..llm.client import LLMClient, get_shared_client
 from ..llm.commentary import CommentaryEngine
 from ..llm.teaching import TeachingAdvisor
 from ..config import GameConfig
 
 
+def _raise_first_error(outcomes: Iterable[object]) -> None:
+    """Re-raise the first exception collected by gather(return_exceptions=True)."""
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            raise outcome
+
+
 @dataclass
 class MatchConfig:
     """Configuration for a match."""
@@ -35,7 +43,7 @@ class MatchConfig:
     enable_teaching: bool = False  # LLM + Stockfish coaching before each human move
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchEvent:
     """An event that occurred during the match."""
 
@@ -45,7 +53,13 @@ class MatchEvent:
 
 
 class Match:
-    """Orchestrates a complete chess match between two players."""
+    """Orchestrates a complete chess match between two players.
+
+    LLM modes use the client from ``get_shared_client``, which outlives
+    the match so later games reuse its connections. Whoever runs matches
+    must call ``close_shared_clients()`` when done, as the CLI does on
+    exit; the match itself never closes it.
+    """
 
     def __init__(
         self,
@@ -96,7 +110,7 @@ class Match:
 
         # Create LLM client if needed
         if mode.requires_openrouter:
-            self._llm_client = LLMClient(self.game_config.llm)
+            self._llm_client = await get_shared_client(self.game_config.llm)
 
         # Create white player
         self.white_player = await self._create_player(
@@ -143,6 +157,8 @@ class Match:
             return HumanPlayer(color, name, human_input_handler)
 
         elif player_type == PlayerType.COMPUTER:
+            # Looked up at call time so patching chess_alive.players.computer.find_stockfish
+            # takes effect (the tests rely on this); everything else is module level
             from ..players.computer import find_stockfish
 
             engine_config = self.game_config.engine
@@ -208,6 +224,16 @@ class Match:
             "is_checkmate": record.is_checkmate,
         })
 
+        # Notify opponent before commentary so players that start thinking
+        # here (e.g. an LLM request) overlap with commentary generation
+        other_player = (
+            self.black_player
+            if current_player == self.white_player
+            else self.white_player
+        )
+        if other_player:
+            await other_player.on_opponent_move(self.game, move)
+
         # Generate commentary
         if self.commentary_engine and self.config.enable_commentary:
             commentaries = await self.commentary_engine.generate_move_commentary(
@@ -221,15 +247,6 @@ class Match:
                     "type": commentary.commentary_type,
                 })
 
-        # Notify opponent
-        other_player = (
-            self.black_player
-            if current_player == self.white_player
-            else self.white_player
-        )
-        if other_player:
-            await other_player.on_opponent_move(self.game, move)
-
         return record
 
     async def run(self) -> GameResult:
@@ -245,70 +262,79 @@ class Match:
         self._running = True
         self.game.state = GameState.PLAYING
 
-        # Notify players of game start
-        await self.white_player.on_game_start(self.game)
-        await self.black_player.on_game_start(self.game)
-
-        await self._emit_event("game_start", {
-            "mode": self.config.mode.name,
-            "white": self.white_player.name,
-            "black": self.black_player.name,
-        })
-
-        # Generate opening commentary
-        if self.commentary_engine and self.config.enable_commentary:
-            commentaries = await self.commentary_engine.generate_game_start_commentary(
-                self.game
-            )
-            for commentary in commentaries:
-                await self._emit_event("commentary", {
-                    "piece": commentary.piece.display_name,
-                    "text": commentary.text,
-                    "type": "game_start",
-                })
-
-        # Main game loop
-        move_count = 0
-        while self._running and not self.game.is_game_over:
-            if move_count >= self.config.max_moves:
-                # Force draw after too many moves
-                break
-
-            record = await self.play_move()
-            if record is None:
-                # Player resigned or error
-                break
-
-            move_count += 1
-
-        # Game over
-        self.game.state = GameState.FINISHED
-        result = self.game.result
-
-        await self._emit_event("game_end", {
-            "result": result.name,
-            "moves": move_count,
-            "pgn": self.game.to_pgn(),
-        })
-
-        # Generate ending commentary
-        if self.commentary_engine and self.config.enable_commentary:
-            commentaries = await self.commentary_engine.generate_game_end_commentary(
-                self.game
+        try:
+            # Notify players of game start concurrently so both engines (e.g.
+            # Stockfish vs Stockfish) spin up in parallel rather than back to
+            # back. Both starts are allowed to finish before a failure is
+            # raised, so the finally block below sees every checked-out engine.
+            _raise_first_error(await asyncio.gather(
+                self.white_player.on_game_start(self.game),
+                self.black_player.on_game_start(self.game),
+                return_exceptions=True,
+            ))
+
+            await self._emit_event("game_start", {
+                "mode": self.config.mode.name,
+                "white": self.white_player.name,
+                "black": self.black_player.name,
+            })
+
+            # Generate opening commentary
+            if self.commentary_engine and self.config.enable_commentary:
+                commentaries = await self.commentary_engine.generate_game_start_commentary(
+                    self.game
+                )
+                for commentary in commentaries:
+                    await self._emit_event("commentary", {
+                        "piece": commentary.piece.display_name,
+                        "text": commentary.text,
+                        "type": "game_start",
+                    })
+
+            # Main game loop
+            move_count = 0
+            while self._running and not self.game.is_game_over:
+                if move_count >= self.config.max_moves:
+                    # Force draw after too many moves
+                    break
+
+                record = await self.play_move()
+                if record is None:
+                    # Player resigned or error
+                    break
+
+                move_count += 1
+
+            # Game over
+            self.game.state = GameState.FINISHED
+            result = self.game.result
+
+            await self._emit_event("game_end", {
+                "result": result.name,
+                "moves": move_count,
+                "pgn": self.game.to_pgn(),
+            })
+
+            # Generate ending commentary
+            if self.commentary_engine and self.config.enable_commentary:
+                commentaries = await self.commentary_engine.generate_game_end_commentary(
+                    self.game
+                )
+                for commentary in commentaries:
+                    await self._emit_event("commentary", {
+                        "piece": commentary.piece.display_name,
+                        "text": commentary.text,
+                        "type": "game_end",
+                    })
+        finally:
+            # Notify players even if the game failed, so engines go back to the pool
+            ended = await asyncio.gather(
+                self.white_player.on_game_end(self.game),
+                self.black_player.on_game_end(self.game),
+                return_exceptions=True,
             )
-            for commentary in commentaries:
-                await self._emit_event("commentary", {
-                    "piece": commentary.piece.display_name,
-                    "text": commentary.text,
-                    "type": "game_end",
-                })
-
-        # Notify players
-        await self.white_player.on_game_end(self.game)
-        await self.black_player.on_game_end(self.game)
-
-        # Cleanup
-        await self._cleanup()
+            await self._cleanup()
+            _raise_first_error(ended)
 
         return result
 
@@ -321,9 +347,8 @@ class Match:
         if self.teaching_advisor:
             await self.teaching_advisor.close()
             self.teaching_advisor = None
-        if self._llm_client:
-            await self._llm_client.close()
-            self._llm_client = None
+        # The LLM client is shared across matches; close_shared_clients() closes it
+        self._llm_client = None
 
     async def __aenter__(self):
         return self
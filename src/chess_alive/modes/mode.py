@@ -89,24 +89,9 @@ class GameMode(Enum):
     # Teaching - Human plays vs Stockfish with LLM coaching before each move
     TEACHING = auto()
 
-    @property
-    def description(self) -> str:
-        """Get a human-readable description."""
-        descriptions = {
-            GameMode.PLAYER_VS_PLAYER: "Two human players",
-            GameMode.PLAYER_VS_COMPUTER: "Human vs Stockfish chess engine",
-            GameMode.COMPUTER_VS_COMPUTER: "Stockfish vs Stockfish",
-            GameMode.PLAYER_VS_LLM: "Human vs LLM-controlled player",
-            GameMode.LLM_VS_LLM: "LLM vs LLM",
-            GameMode.LLM_VS_COMPUTER: "LLM vs Stockfish chess engine",
-            GameMode.TEACHING: "Teaching mode — Human vs Stockfish with LLM coaching",
-        }
-        return descriptions.get(self, "Unknown mode")
-
-    @property
-    def defaults(self) -> ModeConfig:
-        """Get sensible default configuration for this mode."""
-        return _MODE_DEFAULTS.get(self.name, ModeConfig())
+    # Per-member constants, assigned once after the class body below
+    description: str
+    defaults: ModeConfig
 
     @property
     def white_player_type(self) -> PlayerType:
@@ -201,3 +186,21 @@ class GameMode(Enum):
     def list_all(cls) -> list[tuple["GameMode", str]]:
         """List all modes with descriptions."""
         return [(mode, mode.description) for mode in cls]
+
+
+_MODE_DESCRIPTIONS: dict[GameMode, str] = {
+    GameMode.PLAYER_VS_PLAYER: "Two human players",
+    GameMode.PLAYER_VS_COMPUTER: "Human vs Stockfish chess engine",
+    GameMode.COMPUTER_VS_COMPUTER: "Stockfish vs Stockfish",
+    GameMode.PLAYER_VS_LLM: "Human vs LLM-controlled player",
+    GameMode.LLM_VS_LLM: "LLM vs LLM",
+    GameMode.LLM_VS_COMPUTER: "LLM vs Stockfish chess engine",
+    GameMode.TEACHING: "Teaching mode — Human vs Stockfish with LLM coaching",
+}
+
+# Enum members are immutable in spirit, so resolve the description and
+# defaults once at import and store them as plain attributes.
+for _mode in GameMode:
+    _mode.description = _MODE_DESCRIPTIONS.get(_mode, "Unknown mode")
+    _mode.defaults = _MODE_DEFAULTS.get(_mode.name, ModeConfig())
+del _mode
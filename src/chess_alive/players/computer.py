@@ -1,5 +1,8 @@
 """Computer player using Stockfish chess engine."""
 
+import asyncio
+import os
+import shutil
 from typing import Optional
 import chess
 import chess.engine
@@ -10,6 +13,124 @@ from ..core.piece import Color
 from ..config import EngineConfig
 
 
+class EnginePool:
+    """Keeps idle Stockfish processes alive so later games can reuse them.
+
+    Engines are grouped by the settings fixed at startup (path, threads,
+    hash size); per-player options such as skill level are applied on
+    every checkout. Engines belong to the event loop that started them;
+    any that end up outside it are killed rather than driven from the
+    wrong loop.
+    """
+
+    MAX_IDLE = 4
+
+    def __init__(self):
+        self._idle: dict[tuple[str, int, int], list[chess.engine.Protocol]] = {}
+        # Engines handed out and not yet released, with the loop that owns them
+        self._checked_out: dict[chess.engine.Protocol, asyncio.AbstractEventLoop] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @staticmethod
+    def _key(config: EngineConfig) -> tuple[str, int, int]:
+        return (config.path or "", config.threads, config.hash_size)
+
+    @staticmethod
+    def _kill(engine: chess.engine.Protocol):
+        """Kill an engine's process without going through its event loop."""
+        if engine.transport is None:
+            return
+        try:
+            engine.transport.kill()
+        except ProcessLookupError:
+            pass
+
+    async def _quit(
+        self, engine: chess.engine.Protocol, loop: Optional[asyncio.AbstractEventLoop]
+    ):
+        """Quit an engine politely if it belongs to the running loop, else kill it."""
+        if loop is not asyncio.get_running_loop():
+            self._kill(engine)
+            return
+        try:
+            await engine.quit()
+        except chess.engine.EngineError:
+            pass
+
+    async def acquire(self, config: EngineConfig) -> chess.engine.Protocol:
+        """Check out an engine for *config*, starting one if none is idle."""
+        if not config.path:
+            raise RuntimeError("Stockfish path not configured")
+
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Processes bound to a previous loop cannot be driven from this one
+            for stale in self._idle.values():
+                for old in stale:
+                    self._kill(old)
+            self._idle.clear()
+            self._loop = loop
+
+        idle = self._idle.get(self._key(config))
+        engine: Optional[chess.engine.Protocol] = None
+        while idle and engine is None:
+            engine = idle.pop()
+            try:
+                await engine.ping()
+            except chess.engine.EngineError:
+                engine = None
+
+        if engine is None:
+            _, engine = await chess.engine.popen_uci(config.path)
+            try:
+                await engine.configure({
+                    "Threads": config.threads,
+                    "Hash": config.hash_size,
+                })
+            except BaseException:
+                # Not yet tracked anywhere, so shutdown() would never reach it
+                self._kill(engine)
+                raise
+        self._checked_out[engine] = loop
+        return engine
+
+    async def release(self, engine: chess.engine.Protocol, config: EngineConfig):
+        """Return an engine to the pool, or quit it if the pool is full."""
+        loop = self._checked_out.pop(engine, None)
+        if loop is None:
+            # Already quit by shutdown()
+            return
+        idle = self._idle.setdefault(self._key(config), [])
+        if loop is not self._loop or len(idle) >= self.MAX_IDLE:
+            await self._quit(engine, loop)
+            return
+        idle.append(engine)
+
+    def discard(self, engine: chess.engine.Protocol):
+        """Drop a checked-out engine that died, killing whatever is left of it."""
+        self._checked_out.pop(engine, None)
+        self._kill(engine)
+
+    async def shutdown(self):
+        """Quit every engine, idle or still checked out."""
+        engines = [
+            (engine, self._loop) for idle in self._idle.values() for engine in idle
+        ]
+        engines.extend(self._checked_out.items())
+        self._idle.clear()
+        self._checked_out.clear()
+        for engine, loop in engines:
+            await self._quit(engine, loop)
+
+
+_engine_pool = EnginePool()
+
+
+def get_engine_pool() -> EnginePool:
+    """Get the engine pool shared by all computer players."""
+    return _engine_pool
+
+
 class ComputerPlayer(Player):
     """Computer player powered by Stockfish chess engine."""
 
@@ -18,6 +139,7 @@ class ComputerPlayer(Player):
         color: Color,
         name: Optional[str] = None,
         config: Optional[EngineConfig] = None,
+        pool: Optional[EnginePool] = None,
     ):
         """
         Initialize a computer player.
@@ -26,11 +148,19 @@ class ComputerPlayer(Player):
             color: The player's color
             name: Optional player name
             config: Engine configuration
+            pool: Engine pool to check engines out of (defaults to the shared pool)
         """
         super().__init__(color, name or "Stockfish")
         self.config = config or EngineConfig()
-        self._engine: Optional[chess.engine.SimpleEngine] = None
-        self._transport: Optional[chess.engine.Protocol] = None
+        self._pool = pool or get_engine_pool()
+        self._engine: Optional[chess.engine.Protocol] = None
+        # Skill level last sent to the checked-out engine
+        self._engine_skill: Optional[int] = None
+        # Search limit keyed by the (time_limit, depth) it was built from; the
+        # config may be shared with another player, so setters can't clear it
+        self._limit: Optional[tuple[tuple[float, int], chess.engine.Limit]] = None
+        # Identity token per game; a change makes the engine send ucinewgame
+        self._game_token = object()
 
     @property
     def player_type(self) -> PlayerType:
@@ -48,18 +178,22 @@ class ComputerPlayer(Player):
             )
 
         try:
-            self._transport, self._engine = await chess.engine.popen_uci(
-                self.config.path
-            )
+            self._engine = await self._pool.acquire(self.config)
 
-            # Configure engine
+            # Per-player options are reapplied since pooled engines are shared
+            self._engine_skill = None
+            await self._sync_skill_level()
+        except Exception as e:
+            raise RuntimeError(f"Failed to start Stockfish: {e}")
+
+    async def _sync_skill_level(self):
+        """Send the configured skill level to the engine if it changed."""
+        assert self._engine is not None
+        if self._engine_skill != self.config.skill_level:
             await self._engine.configure({
-                "Threads": self.config.threads,
-                "Hash": self.config.hash_size,
                 "Skill Level": self.config.skill_level,
             })
-        except Exception as e:
-            raise RuntimeError(f"Failed to start Stockfish: {e}")
+            self._engine_skill = self.config.skill_level
 
     async def get_move(self, game: ChessGame) -> Optional[chess.Move]:
         """Get move from Stockfish."""
@@ -69,17 +203,22 @@ class ComputerPlayer(Player):
         await self._ensure_engine()
 
         assert self._engine is not None
+        key = (self.config.time_limit, self.config.depth)
+        if self._limit is None or self._limit[0] != key:
+            self._limit = (key, chess.engine.Limit(time=key[0], depth=key[1]))
+
         try:
+            await self._sync_skill_level()
+
             # Get best move with time limit
             result = await self._engine.play(
                 game.board,
-                chess.engine.Limit(
-                    time=self.config.time_limit,
-                    depth=self.config.depth,
-                ),
+                self._limit[1],
+                game=self._game_token,
             )
             return result.move
         except chess.engine.EngineTerminatedError:
+            self._pool.discard(self._engine)
             self._engine = None
             return None
 
@@ -101,6 +240,7 @@ class ComputerPlayer(Player):
             )
             return info
         except chess.engine.EngineTerminatedError:
+            self._pool.discard(self._engine)
             self._engine = None
             return None
 
@@ -125,6 +265,7 @@ class ComputerPlayer(Player):
 
     async def on_game_start(self, game: ChessGame):
         """Start the engine when game begins."""
+        self._game_token = object()
         await self._ensure_engine()
 
     async def on_game_end(self, game: ChessGame):
@@ -132,14 +273,13 @@ class ComputerPlayer(Player):
         await self._cleanup()
 
     async def _cleanup(self):
-        """Clean up engine resources."""
+        """Return the engine to the pool for the next game."""
         if self._engine:
-            await self._engine.quit()
-            self._engine = None
-            self._transport = None
+            engine, self._engine = self._engine, None
+            await self._pool.release(engine, self.config)
 
     def set_skill_level(self, level: int):
-        """Set engine skill level (0-20)."""
+        """Set engine skill level (0-20); a running engine picks it up on the next move."""
         self.config.skill_level = max(0, min(20, level))
 
     def set_time_limit(self, seconds: float):
@@ -157,18 +297,20 @@ class StockfishNotFoundError(Exception):
     pass
 
 
+# Last Stockfish path found; misses are not cached so a later install is picked up
+_stockfish_path: Optional[str] = None
+
+
 async def find_stockfish() -> Optional[str]:
     """Try to find Stockfish executable on the system."""
-    import shutil
+
+    global _stockfish_path
+    if _stockfish_path is not None:
+        return _stockfish_path
 
     # Common names for stockfish executable
     names = ["stockfish", "stockfish.exe", "stockfish-ubuntu-x86-64", "stockfish_15"]
 
-    for name in names:
-        path = shutil.which(name)
-        if path:
-            return path
-
     # Common installation paths
     common_paths = [
         "/usr/bin/stockfish",
@@ -179,10 +321,13 @@ async def find_stockfish() -> Optional[str]:
         "C:\\stockfish\\stockfish.exe",
     ]
 
-    import os
-
-    for path in common_paths:
-        if os.path.isfile(path):
-            return path
+    # Probe everything in worker threads so discovery doesn't block the loop
+    found, exists = await asyncio.gather(
+        asyncio.gather(*(asyncio.to_thread(shutil.which, name) for name in names)),
+        asyncio.gather(*(asyncio.to_thread(os.path.isfile, path) for path in common_paths)),
+    )
 
-    return None
+    # Keep the original preference order: PATH lookups first, then known paths
+    candidates = list(found) + [path if ok else None for path, ok in zip(common_paths, exists)]
+    _stockfish_path = next((path for path in candidates if path), None)
+    return _stockfish_path
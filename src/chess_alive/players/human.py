@@ -8,6 +8,9 @@ from .base import Player, PlayerType
 from ..core.game import ChessGame
 from ..core.piece import Color
 
+# Inputs that end the game for this player
+_QUIT_COMMANDS = frozenset({"quit", "exit", "resign"})
+
 
 class HumanPlayer(Player):
     """Human player that gets moves from user input."""
@@ -43,23 +46,22 @@ class HumanPlayer(Player):
                 if self._input_handler:
                     move_str = await self._input_handler(game)
                 else:
-                    # Default: use asyncio-compatible input
-                    move_str = await asyncio.get_event_loop().run_in_executor(
-                        None, lambda: input(f"{self.name}'s move: ").strip()
-                    )
+                    # Default: read stdin in a worker thread
+                    move_str = (await asyncio.to_thread(input, f"{self.name}'s move: ")).strip()
 
                 if not move_str:
                     continue
 
                 # Handle special commands
-                if move_str.lower() in ("quit", "exit", "resign"):
+                command = move_str.lower()
+                if command in _QUIT_COMMANDS:
                     return None
 
-                if move_str.lower() == "help":
+                if command == "help":
                     self._show_help(game)
                     continue
 
-                if move_str.lower() == "moves":
+                if command == "moves":
                     self._show_legal_moves(game)
                     continue
 
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import random
 import re
 from typing import Optional, TYPE_CHECKING
 import chess
@@ -15,9 +17,23 @@ from ..core.game import ChessGame
 from ..core.piece import Color
 
 
+# Response parsing patterns, compiled once at import
+_JSON_MOVE_RE = re.compile(r'\{[^{}]*"move"\s*:\s*"[^"]*"[^{}]*\}')
+_MOVE_TAG_RE = re.compile(r"MOVE:\s*([A-Za-z0-9\-\+\#\=]+)", re.IGNORECASE)
+_UCI_RE = re.compile(r"\b([a-h][1-8][a-h][1-8][qrbn]?)\b")
+_REASONING_RE = re.compile(r"REASONING:\s*(.+?)(?=MOVE:|$)", re.DOTALL | re.IGNORECASE)
+
+
 class LLMPlayer(Player):
     """Player that uses an LLM to decide chess moves."""
 
+    STYLE_HINTS = {
+        "aggressive": "You prefer attacking play, piece sacrifices for initiative, and putting pressure on the opponent's king.",
+        "defensive": "You prefer solid, positional play, careful defense, and waiting for opponent mistakes.",
+        "balanced": "You play a balanced style, combining tactical awareness with positional understanding.",
+        "creative": "You enjoy creative, unexpected moves and are willing to take risks for interesting positions.",
+    }
+
     def __init__(
         self,
         color: Color,
@@ -38,6 +54,12 @@ class LLMPlayer(Player):
         self._client = llm_client
         self.style = style
         self._move_history_context: list[str] = []
+        # Move request started early in on_opponent_move, keyed by FEN
+        self._pending: Optional[tuple[str, asyncio.Task[str]]] = None
+        # SAN -> move for the last position seen, keyed by FEN
+        self._legal_san_cache: Optional[tuple[str, dict[str, chess.Move]]] = None
+        self._legal_san_pattern_cache: Optional[tuple[str, re.Pattern[str]]] = None
+        self._system_prompt: Optional[tuple[tuple[Color, str], str]] = None
 
     @property
     def player_type(self) -> PlayerType:
@@ -55,15 +77,15 @@ class LLMPlayer(Player):
         if self._client is None:
             raise RuntimeError("LLM client not configured for LLMPlayer")
 
-        # Build the prompt
-        prompt = self._build_move_prompt(game)
+        # Forced move: no need to ask
+        forced = self._forced_move(game)
+        if forced is not None:
+            return forced
 
-        # Get LLM response
-        response = await self._client.complete(
-            prompt,
-            system_prompt=self._get_system_prompt(),
-            temperature=0.3,  # Lower temperature for more consistent moves
-        )
+        # Get LLM response, reusing the request started on the opponent's move
+        response = await self._take_pending(game)
+        if response is None:
+            response = await self._request_move(game)
 
         # Try JSON parsing first, then fall back to text parsing
         move = self._parse_json_response(response, game)
@@ -83,26 +105,98 @@ class LLMPlayer(Player):
         # Last resort: pick a random legal move
         legal_moves = game.get_legal_moves()
         if legal_moves:
-            import random
             return random.choice(legal_moves)
 
         return None
 
+    def _forced_move(self, game: ChessGame) -> Optional[chess.Move]:
+        """Return the only legal move, if there is exactly one."""
+        legal = self._legal_san(game)
+        if len(legal) == 1:
+            return next(iter(legal.values()))
+        return None
+
+    async def _request_move(self, game: ChessGame) -> str:
+        """Ask the LLM for a move in the current position.
+
+        The response is streamed and cut off as soon as it contains a
+        legal JSON move, so we don't wait on trailing tokens.
+        """
+        assert self._client is not None
+        prompt = self._build_move_prompt(game)
+        system_prompt = self._get_system_prompt()
+
+        chunks = self._client.complete_stream(
+            prompt,
+            system_prompt=system_prompt,
+            temperature=0.3,  # Lower temperature for more consistent moves
+        )
+        response = ""
+        try:
+            async for chunk in chunks:
+                response += chunk
+                # A JSON move can only complete on a chunk that closes the object
+                if "}" in chunk:
+                    move = self._parse_json_response(response, game)
+                    if move and game.is_legal_move(move):
+                        break
+        finally:
+            await chunks.aclose()
+        return response
+
+    async def _take_pending(self, game: ChessGame) -> Optional[str]:
+        """Await the prefetched response if it was made for this position."""
+        if self._pending is None:
+            return None
+        fen, task = self._pending
+        self._pending = None
+        if fen != game.fen:
+            self._discard(task)
+            return None
+        return await task
+
+    def _cancel_pending(self):
+        """Drop any outstanding prefetched move request."""
+        if self._pending is not None:
+            self._discard(self._pending[1])
+            self._pending = None
+
+    @staticmethod
+    def _discard(task: asyncio.Task[str]):
+        """Cancel a prefetch, retrieving any error it ends with instead."""
+        task.cancel()
+        # Cleanup can still fail mid-cancel (e.g. closing the stream); without
+        # this asyncio logs "Task exception was never retrieved"
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+    async def on_opponent_move(self, game: ChessGame, move: chess.Move):
+        """Start the move request now so it overlaps the opponent's commentary."""
+        self._cancel_pending()
+        if self._client is None or game.current_turn != self.color or game.is_game_over:
+            return
+        if self._forced_move(game) is not None:
+            return
+        self._pending = (game.fen, asyncio.create_task(self._request_move(game)))
+
+    async def on_game_end(self, game: ChessGame):
+        """Cancel any prefetched move request."""
+        self._cancel_pending()
+
     def _get_system_prompt(self) -> str:
-        """Get the system prompt for the LLM."""
-        style_hints = {
-            "aggressive": "You prefer attacking play, piece sacrifices for initiative, and putting pressure on the opponent's king.",
-            "defensive": "You prefer solid, positional play, careful defense, and waiting for opponent mistakes.",
-            "balanced": "You play a balanced style, combining tactical awareness with positional understanding.",
-            "creative": "You enjoy creative, unexpected moves and are willing to take risks for interesting positions.",
-        }
+        """Get the system prompt for the LLM, rebuilt only if color or style change."""
+        key = (self.color, self.style)
+        if self._system_prompt is None or self._system_prompt[0] != key:
+            self._system_prompt = (key, self._build_system_prompt())
+        return self._system_prompt[1]
 
-        style_hint = style_hints.get(self.style, style_hints["balanced"])
+    def _build_system_prompt(self) -> str:
+        """Build the system prompt for the LLM."""
+        style_hint = self.STYLE_HINTS.get(self.style, self.STYLE_HINTS["balanced"])
 
         return f"""You are an expert chess player playing as {self.color.name_str}.
 {style_hint}
 
-When asked for a move, analyze the position carefully and respond with your chosen move.
+Positions are given in FEN. When asked for a move, analyze the position carefully and respond with your chosen move.
 
 IMPORTANT: Respond with a JSON object in this exact format:
 {{"move": "<your move in SAN>", "reasoning": "<brief analysis>"}}
@@ -117,18 +211,47 @@ If you cannot use JSON, format your response as: MOVE: <your move>
 
 Always choose a legal move from the provided list of legal moves."""
 
+    def _legal_san(self, game: ChessGame) -> dict[str, chess.Move]:
+        """Map SAN to legal moves, computed once per position.
+
+        ``board.san`` is expensive, and the prompt, the fallback parser and
+        the prefetch path all need the same list for the same position.
+        """
+        fen = game.fen
+        if self._legal_san_cache is None or self._legal_san_cache[0] != fen:
+            self._legal_san_cache = (
+                fen,
+                {game.board.san(m): m for m in game.get_legal_moves()},
+            )
+        return self._legal_san_cache[1]
+
+    def _legal_san_pattern(self, game: ChessGame) -> re.Pattern[str]:
+        """Regex matching any legal SAN as a whole word, compiled once per position.
+
+        Longer SAN comes first so "O-O-O" wins over "O-O". SAN can carry
+        "+" or "#", so the alternatives still need escaping, and the end is
+        a lookahead since ``\\b`` never matches right after those.
+        """
+        fen = game.fen
+        if self._legal_san_pattern_cache is None or self._legal_san_pattern_cache[0] != fen:
+            alternatives = sorted(self._legal_san(game), key=len, reverse=True)
+            self._legal_san_pattern_cache = (
+                fen,
+                re.compile(rf"\b(?:{'|'.join(map(re.escape, alternatives))})(?!\w)"),
+            )
+        return self._legal_san_pattern_cache[1]
+
     def _build_move_prompt(self, game: ChessGame) -> str:
         """Build the prompt for getting a move."""
-        # Get board state
-        board_str = str(game.board)
-
         # Get legal moves
-        legal_moves = [game.board.san(m) for m in game.get_legal_moves()]
+        legal_moves = list(self._legal_san(game))
 
-        # Build recent move history
+        # Build recent move history from the last 10 plies, indexing in place
+        history = game.move_history
         recent_moves = []
-        for i, record in enumerate(game.move_history[-10:]):  # Last 10 moves
-            move_num = (len(game.move_history) - 10 + i) // 2 + 1
+        for ply in range(max(0, len(history) - 10), len(history)):
+            record = history[ply]
+            move_num = ply // 2 + 1
             if record.piece.color == Color.WHITE:
                 recent_moves.append(f"{move_num}. {record.san}")
             else:
@@ -150,8 +273,6 @@ Always choose a legal move from the provided list of legal moves."""
 
         prompt = f"""Current position (you are playing {self.color.name_str}):
 
-{board_str}
-
 FEN: {game.fen}
 
 Move history: {move_history_str}
@@ -173,8 +294,12 @@ Respond with JSON: {{"move": "<SAN>", "reasoning": "<analysis>"}}"""
         Tries to extract a JSON object with a "move" field from the response.
         Handles cases where the JSON is embedded in surrounding text.
         """
+        # Plain-text replies can't hold a "move" key; skip the regex and decoder
+        if '"move"' not in response:
+            return None
+
         # Try to find JSON in the response
-        json_match = re.search(r'\{[^{}]*"move"\s*:\s*"[^"]*"[^{}]*\}', response)
+        json_match = _JSON_MOVE_RE.search(response)
         if json_match:
             try:
                 data = json.loads(json_match.group())
@@ -200,8 +325,7 @@ Respond with JSON: {{"move": "<SAN>", "reasoning": "<analysis>"}}"""
     ) -> Optional[chess.Move]:
         """Parse a move from the LLM response using text patterns."""
         # Look for "MOVE: <move>" pattern
-        move_pattern = r"MOVE:\s*([A-Za-z0-9\-\+\#\=]+)"
-        match = re.search(move_pattern, response, re.IGNORECASE)
+        match = _MOVE_TAG_RE.search(response)
 
         if match:
             move_str = match.group(1).strip()
@@ -214,17 +338,16 @@ Respond with JSON: {{"move": "<SAN>", "reasoning": "<analysis>"}}"""
     ) -> Optional[chess.Move]:
         """Try to extract any valid move from the response."""
         # Get all legal moves in SAN
-        legal_san = {game.board.san(m): m for m in game.get_legal_moves()}
+        legal_san = self._legal_san(game)
 
-        # Check if any legal move appears in the response
-        for san, move in legal_san.items():
-            # Use word boundary matching
-            if re.search(rf"\b{re.escape(san)}\b", response):
-                return move
+        # Scan the response once for any legal move
+        if legal_san:
+            match = self._legal_san_pattern(game).search(response)
+            if match:
+                return legal_san[match.group()]
 
         # Try UCI format
-        uci_pattern = r"\b([a-h][1-8][a-h][1-8][qrbn]?)\b"
-        for match in re.finditer(uci_pattern, response):
+        for match in _UCI_RE.finditer(response):
             uci = match.group(1)
             try:
                 move = chess.Move.from_uci(uci)
@@ -250,6 +373,13 @@ Respond with JSON: {{"move": "<SAN>", "reasoning": "<analysis>"}}"""
         if self._client is None:
             raise RuntimeError("LLM client not configured for LLMPlayer")
 
+        # A prefetched reply has no detailed reasoning; ask again instead
+        self._cancel_pending()
+
+        forced = self._forced_move(game)
+        if forced is not None:
+            return forced, "Forced move."
+
         prompt = self._build_move_prompt(game) + """
 
 Please provide detailed reasoning for your move.
@@ -265,7 +395,7 @@ Respond with JSON: {"move": "<SAN>", "reasoning": "<detailed analysis>"}"""
         reasoning = ""
         move = None
 
-        json_match = re.search(r'\{[^{}]*"move"\s*:\s*"[^"]*"[^{}]*\}', response)
+        json_match = _JSON_MOVE_RE.search(response) if '"move"' in response else None
         if json_match:
             try:
                 data = json.loads(json_match.group())
@@ -279,9 +409,7 @@ Respond with JSON: {"move": "<SAN>", "reasoning": "<detailed analysis>"}"""
                 pass
 
         # Fall back to text parsing
-        reasoning_match = re.search(
-            r"REASONING:\s*(.+?)(?=MOVE:|$)", response, re.DOTALL | re.IGNORECASE
-        )
+        reasoning_match = _REASONING_RE.search(response)
         reasoning = reasoning_match.group(1).strip() if reasoning_match else response
 
         # Extract move
@@ -1,11 +1,21 @@
 """User interface components."""
 
+from importlib.util import find_spec
+
 from .display import BoardDisplay
 from .cli import CLI
 
-# GUI import is optional (requires tkinter)
-try:
-    from .gui import ChessAliveGUI
-    __all__ = ["BoardDisplay", "CLI", "ChessAliveGUI"]
-except ImportError:
-    __all__ = ["BoardDisplay", "CLI"]
+__all__ = ["BoardDisplay", "CLI"]
+
+# GUI is optional (requires tkinter) and loaded on first access, so the
+# CLI doesn't pay for importing Tk at startup
+if find_spec("_tkinter") is not None:
+    __all__.append("ChessAliveGUI")
+
+
+def __getattr__(name: str):
+    if name == "ChessAliveGUI":
+        from .gui import ChessAliveGUI
+
+        return ChessAliveGUI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,16 +3,20 @@
 import asyncio
 import sys
 from typing import Optional, Callable, Awaitable
+import chess
 from rich.console import Console
 from rich.prompt import Prompt, Confirm
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 
 from .display import BoardDisplay
 from ..modes.mode import GameMode
 from ..modes.match import Match, MatchConfig, MatchEvent
 from ..core.game import ChessGame, GameResult
-from ..config import get_config, PROVIDER_DEFAULTS
+from ..players.computer import get_engine_pool
+from ..llm.client import close_shared_clients
+from ..config import get_config, reload_config, PROVIDER_DEFAULTS
 from ..credentials import (
     save_api_key,
     clear_api_key,
@@ -35,6 +39,31 @@ class CLI:
     Where every piece has a voice!
     """
 
+    # Menu rows: (option, short name, description)
+    MENU_MODES = (
+        ("1", "pvp", "Player vs Player - Two humans"),
+        ("2", "pvc", "Player vs Computer - Human vs Stockfish"),
+        ("3", "cvc", "Computer vs Computer - Stockfish vs Stockfish"),
+        ("4", "pvl", "Player vs LLM - Human vs AI language model"),
+        ("5", "lvl", "LLM vs LLM - Two AI language models"),
+        ("6", "lvc", "LLM vs Computer - AI language model vs Stockfish"),
+        ("7", "teaching", "Teaching mode - Human vs Stockfish with LLM coaching"),
+    )
+
+    MODE_MAP = {
+        "1": GameMode.PLAYER_VS_PLAYER,
+        "2": GameMode.PLAYER_VS_COMPUTER,
+        "3": GameMode.COMPUTER_VS_COMPUTER,
+        "4": GameMode.PLAYER_VS_LLM,
+        "5": GameMode.LLM_VS_LLM,
+        "6": GameMode.LLM_VS_COMPUTER,
+        "7": GameMode.TEACHING,
+    }
+
+    QUIT_CHOICES = frozenset({"quit", "q"})
+
+    MENU_CHOICES = [*MODE_MAP, "setup", "quit", "q"]
+
     def __init__(self, console: Optional[Console] = None):
         """Initialize CLI."""
         self.console = console or Console()
@@ -43,10 +72,18 @@ class CLI:
         self._current_match: Optional[Match] = None
         # Callback set to TeachingAdvisor.analyze during teaching mode matches
         self._pre_move_advisor: Optional[Callable[[ChessGame], Awaitable]] = None
+        # Position last shown at the move prompt; retries skip the redraw
+        self._prompted_position: Optional[tuple[str, Optional[chess.Move]]] = None
+        # Static renderables, built on first use
+        self._banner_panel: Optional[Panel] = None
+        self._menu_table: Optional[Table] = None
 
     def print_banner(self):
         """Print the welcome banner."""
-        self.console.print(Panel(self.BANNER, style="bold blue"))
+        if self._banner_panel is None:
+            # Plain Text: the ASCII art is not markup and needs no parsing
+            self._banner_panel = Panel(Text(self.BANNER), style="bold blue")
+        self.console.print(self._banner_panel)
 
     def _print_provider_status(self):
         """Print the current LLM provider status."""
@@ -62,25 +99,17 @@ class CLI:
 
     def print_menu(self):
         """Print the main menu."""
-        table = Table(title="Game Modes", show_header=True)
-        table.add_column("Option", style="cyan")
-        table.add_column("Mode", style="white")
-        table.add_column("Description", style="dim")
-
-        modes = [
-            ("1", "pvp", "Player vs Player - Two humans"),
-            ("2", "pvc", "Player vs Computer - Human vs Stockfish"),
-            ("3", "cvc", "Computer vs Computer - Stockfish vs Stockfish"),
-            ("4", "pvl", "Player vs LLM - Human vs AI language model"),
-            ("5", "lvl", "LLM vs LLM - Two AI language models"),
-            ("6", "lvc", "LLM vs Computer - AI language model vs Stockfish"),
-            ("7", "teaching", "Teaching mode - Human vs Stockfish with LLM coaching"),
-        ]
-
-        for opt, mode, desc in modes:
-            table.add_row(opt, mode, desc)
-
-        self.console.print(table)
+        if self._menu_table is None:
+            table = Table(title="Game Modes", show_header=True)
+            table.add_column("Option", style="cyan")
+            table.add_column("Mode", style="white")
+            table.add_column("Description", style="dim")
+
+            for opt, mode, desc in self.MENU_MODES:
+                table.add_row(opt, mode, desc)
+            self._menu_table = table
+
+        self.console.print(self._menu_table)
 
         llm = self.config.llm
         status = f"[dim]{llm.provider_display}: {llm.model}[/dim]"
@@ -96,11 +125,11 @@ class CLI:
         while True:
             choice = Prompt.ask(
                 "\n[bold]Select game mode[/bold]",
-                choices=["1", "2", "3", "4", "5", "6", "7", "setup", "quit", "q"],
+                choices=self.MENU_CHOICES,
                 default="1",
             )
 
-            if choice in ("quit", "q"):
+            if choice in self.QUIT_CHOICES:
                 return None
 
             if choice == "setup":
@@ -108,17 +137,7 @@ class CLI:
                 self.print_menu()
                 continue
 
-            mode_map = {
-                "1": GameMode.PLAYER_VS_PLAYER,
-                "2": GameMode.PLAYER_VS_COMPUTER,
-                "3": GameMode.COMPUTER_VS_COMPUTER,
-                "4": GameMode.PLAYER_VS_LLM,
-                "5": GameMode.LLM_VS_LLM,
-                "6": GameMode.LLM_VS_COMPUTER,
-                "7": GameMode.TEACHING,
-            }
-
-            mode = mode_map.get(choice)
+            mode = self.MODE_MAP.get(choice)
             if mode:
                 return mode
 
@@ -134,14 +153,15 @@ class CLI:
             default="back",
         )
 
-        if action == "ollama":
-            self._setup_ollama()
-        elif action == "openrouter":
-            self._setup_openrouter()
-        elif action == "show":
-            self._print_provider_status()
-        elif action == "clear":
-            self._clear_config()
+        match action:
+            case "ollama":
+                self._setup_ollama()
+            case "openrouter":
+                self._setup_openrouter()
+            case "show":
+                self._print_provider_status()
+            case "clear":
+                self._clear_config()
 
     def _setup_ollama(self):
         """Configure Ollama as the LLM provider."""
@@ -160,7 +180,7 @@ class CLI:
         self.console.print(f"[green]Ollama config saved to {path}[/green]")
 
         # Reload
-        self.config = get_config()
+        self.config = reload_config()
         self._print_provider_status()
 
     def _setup_openrouter(self):
@@ -187,7 +207,7 @@ class CLI:
         )
 
         # Reload
-        self.config = get_config()
+        self.config = reload_config()
         self._print_provider_status()
 
     def _clear_config(self):
@@ -199,7 +219,7 @@ class CLI:
         if Confirm.ask("Remove saved LLM config?", default=False):
             clear_api_key()
             self.console.print("[green]Saved config removed.[/green]")
-            self.config = get_config()
+            self.config = reload_config()
 
     def configure_match(self, mode: GameMode) -> MatchConfig:
         """Configure match settings, pre-populated from mode defaults."""
@@ -286,31 +306,43 @@ class CLI:
 
     async def handle_event(self, event: MatchEvent):
         """Handle match events for display."""
-        if event.event_type == "game_start":
-            self.console.print("\n[bold green]Game started![/bold green]")
-            self.console.print(f"White: {event.data['white']}")
-            self.console.print(f"Black: {event.data['black']}")
-            self.console.print()
-
-        elif event.event_type == "move":
-            # Board is printed after each move in the main loop
-            pass
-
-        elif event.event_type == "commentary":
-            self.display.print_commentary(
-                event.data["piece"],
-                event.data["text"],
-            )
+        match event.event_type:
+            case "game_start":
+                self.console.print(
+                    "\n[bold green]Game started![/bold green]\n"
+                    f"White: {event.data['white']}\n"
+                    f"Black: {event.data['black']}\n"
+                )
 
-        elif event.event_type == "game_end":
-            self.console.print("\n[bold]Game Over![/bold]")
-            self.console.print(f"Result: {event.data['result']}")
-            self.console.print(f"Total moves: {event.data['moves']}")
+            case "move":
+                # Board is printed after each move in the main loop
+                pass
+
+            case "commentary":
+                self.display.print_commentary(
+                    event.data["piece"],
+                    event.data["text"],
+                )
+
+            case "game_end":
+                self.console.print(
+                    "\n[bold]Game Over![/bold]\n"
+                    f"Result: {event.data['result']}\n"
+                    f"Total moves: {event.data['moves']}"
+                )
 
     async def human_input_handler(self, game: ChessGame) -> str:
         """Handle human move input."""
-        # Print current board state
         last_move = game.move_history[-1].move if game.move_history else None
+        position = (game.fen, last_move)
+
+        # Re-prompts after an invalid move, 'help' or 'moves' keep the board
+        # and advice already on screen
+        if position == self._prompted_position:
+            return await self._ask_move(game)
+        self._prompted_position = position
+
+        # Print current board state
         self.display.print_board(game, last_move=last_move)
         self.display.print_game_status(game)
         self.display.print_captured_pieces(game)
@@ -325,12 +357,13 @@ class CLI:
                     f"[yellow]Teaching analysis unavailable: {e}[/yellow]"
                 )
 
-        # Get input
-        return await asyncio.get_event_loop().run_in_executor(
-            None,
-            lambda: Prompt.ask(
-                f"\n[bold]{game.current_turn.name_str}'s move[/bold] (or 'help')"
-            ),
+        return await self._ask_move(game)
+
+    async def _ask_move(self, game: ChessGame) -> str:
+        """Prompt the side to move for their move."""
+        return await asyncio.to_thread(
+            Prompt.ask,
+            f"\n[bold]{game.current_turn.name_str}'s move[/bold] (or 'help')",
         )
 
     async def run_match(self, match_config: MatchConfig) -> GameResult:
@@ -338,6 +371,7 @@ class CLI:
         async with Match(match_config, self.config, self.handle_event) as match:
             self._current_match = match
             self._pre_move_advisor = None
+            self._prompted_position = None
 
             # Set up the match
             try:
@@ -389,36 +423,41 @@ class CLI:
                 "Ollama (local) or OpenRouter.[/dim]\n"
             )
 
-        while True:
-            mode = await self.select_mode()
-            if mode is None:
-                self.console.print("\n[bold]Thanks for playing ChessAlive![/bold]")
-                break
-
-            # Check requirements
-            if mode.requires_openrouter and not self.config.llm.is_configured:
-                self.console.print(
-                    "[bold red]Error:[/bold red] This mode requires an LLM provider."
-                )
-                self.console.print(
-                    "[dim]Type 'setup' to configure Ollama or OpenRouter.[/dim]"
-                )
-                continue
-
-            # Configure and run match
-            match_config = self.configure_match(mode)
-
-            try:
-                await self.run_match(match_config)
-            except KeyboardInterrupt:
-                self.console.print("\n[yellow]Match interrupted[/yellow]")
-            except Exception as e:
-                self.console.print(f"[bold red]Error:[/bold red] {e}")
-
-            # Play again?
-            if not Confirm.ask("\nPlay again?", default=True):
-                self.console.print("\n[bold]Thanks for playing ChessAlive![/bold]")
-                break
+        try:
+            while True:
+                mode = await self.select_mode()
+                if mode is None:
+                    self.console.print("\n[bold]Thanks for playing ChessAlive![/bold]")
+                    break
+
+                # Check requirements
+                if mode.requires_openrouter and not self.config.llm.is_configured:
+                    self.console.print(
+                        "[bold red]Error:[/bold red] This mode requires an LLM provider."
+                    )
+                    self.console.print(
+                        "[dim]Type 'setup' to configure Ollama or OpenRouter.[/dim]"
+                    )
+                    continue
+
+                # Configure and run match
+                match_config = self.configure_match(mode)
+
+                try:
+                    await self.run_match(match_config)
+                except KeyboardInterrupt:
+                    self.console.print("\n[yellow]Match interrupted[/yellow]")
+                except Exception as e:
+                    self.console.print(f"[bold red]Error:[/bold red] {e}")
+
+                # Play again?
+                if not Confirm.ask("\nPlay again?", default=True):
+                    self.console.print("\n[bold]Thanks for playing ChessAlive![/bold]")
+                    break
+        finally:
+            # Quit any Stockfish processes and LLM connections kept warm between games
+            await get_engine_pool().shutdown()
+            await close_shared_clients()
 
 
 def main():
@@ -427,7 +466,7 @@ def main():
     try:
         asyncio.run(cli.run())
     except KeyboardInterrupt:
-        print("\nGoodbye!")
+        sys.stdout.write("\nGoodbye!\n")
         sys.exit(0)
 
 
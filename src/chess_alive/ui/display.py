@@ -1,5 +1,6 @@
 """Board display utilities using Rich library."""
 
+from collections import Counter, OrderedDict
 from typing import Optional
 from rich.console import Console
 from rich.table import Table
@@ -11,6 +12,11 @@ import chess
 from ..core.game import ChessGame, MoveRecord, GameResult
 from ..core.piece import Color, PieceType
 
+# Static board frame pieces
+_BOARD_BORDER = "  +" + "-" * 17 + "+"
+_FILE_LABELS = "    a  b  c  d  e  f  g  h"
+_FILE_LABELS_FLIPPED = "    h  g  f  e  d  c  b  a"
+
 
 class BoardDisplay:
     """Display chess board and game state using Rich."""
@@ -58,6 +64,9 @@ class BoardDisplay:
     STYLE_HEADER = Style(color="bright_blue", bold=True)
     STYLE_DIM = Style(dim=True)
 
+    # Rendered boards kept for reuse
+    FRAME_CACHE_SIZE = 256
+
     def __init__(
         self,
         console: Optional[Console] = None,
@@ -79,6 +88,11 @@ class BoardDisplay:
         self.light_square = light_square
         self.dark_square = dark_square
         self.pieces = self.UNICODE_PIECES if use_unicode else self.ASCII_PIECES
+        # Flat symbol table indexed by piece_type | color << 3
+        self._symbols = [" "] * 16
+        for (piece_type, color), symbol in self.pieces.items():
+            self._symbols[piece_type | color << 3] = symbol
+        self._frames: OrderedDict[tuple, str] = OrderedDict()
 
     def get_piece_symbol(self, piece: Optional[chess.Piece]) -> str:
         """Get the display symbol for a piece."""
@@ -105,42 +119,61 @@ class BoardDisplay:
         Returns:
             String representation of the board
         """
-        highlight_squares = highlight_squares or set()
+        # Copy so the caller's set isn't grown by the last-move squares
+        highlight_squares = set(highlight_squares) if highlight_squares else set()
 
         # Add last move squares to highlights
         if last_move:
             highlight_squares.add(last_move.from_square)
             highlight_squares.add(last_move.to_square)
 
-        lines = []
+        # Piece placement is fully described by the piece-type bitboards
+        # plus White's occupancy, which are cheaper to read than a FEN
+        board = game.board
+        key = (
+            board.pawns, board.knights, board.bishops, board.rooks,
+            board.queens, board.kings, board.occupied_co[chess.WHITE],
+            flip, frozenset(highlight_squares),
+        )
+        frame = self._frames.get(key)
+        if frame is not None:
+            self._frames.move_to_end(key)
+            return frame
+
+        frame = self._draw_board(board, flip, highlight_squares)
+        self._frames[key] = frame
+        if len(self._frames) > self.FRAME_CACHE_SIZE:
+            self._frames.popitem(last=False)
+        return frame
+
+    def _draw_board(
+        self, board: chess.Board, flip: bool, highlight_squares: set[chess.Square]
+    ) -> str:
+        """Draw the board text for render_board."""
+        # Fill only occupied squares rather than probing all 64
+        symbols = self._symbols
+        grid = [" "] * 64
+        for square, piece in board.piece_map().items():
+            grid[square] = symbols[piece.piece_type | piece.color << 3]
+
         ranks = range(7, -1, -1) if not flip else range(8)
         files = range(8) if not flip else range(7, -1, -1)
 
-        # Top border
-        lines.append("  +" + "-" * 17 + "+")
-
+        lines = [_BOARD_BORDER]
         for rank in ranks:
-            line_parts = [f"{rank + 1} |"]
+            cells = []
             for file in files:
-                square = chess.square(file, rank)
-                piece = game.board.piece_at(square)
-                symbol = self.get_piece_symbol(piece)
-
+                square = rank * 8 + file
                 # Add highlighting marker
                 if square in highlight_squares:
-                    line_parts.append(f"[{symbol}]")
+                    cells.append(f"[{grid[square]}]")
                 else:
-                    line_parts.append(f" {symbol} ")
-
-            line_parts.append("|")
-            lines.append("".join(line_parts))
-
-        # Bottom border
-        lines.append("  +" + "-" * 17 + "+")
+                    cells.append(f" {grid[square]} ")
+            lines.append(f"{rank + 1} |{''.join(cells)}|")
+        lines.append(_BOARD_BORDER)
 
         # File labels
-        file_labels = "    a  b  c  d  e  f  g  h" if not flip else "    h  g  f  e  d  c  b  a"
-        lines.append(file_labels)
+        lines.append(_FILE_LABELS if not flip else _FILE_LABELS_FLIPPED)
 
         return "\n".join(lines)
 
@@ -240,21 +273,14 @@ class BoardDisplay:
         table.add_column("Black", min_width=8)
         table.add_column("Notes", style="dim", max_width=30)
 
-        # Pair moves into (white, black) rows
-        pairs: list[tuple[MoveRecord, Optional[MoveRecord]]] = []
-        for i in range(0, len(history), 2):
-            white = history[i]
-            black = history[i + 1] if i + 1 < len(history) else None
-            pairs.append((white, black))
+        # Pair moves into (white, black) rows, building only the rows shown
+        total_pairs = (len(history) + 1) // 2
+        first = max(0, total_pairs - last_n) if last_n else 0
 
-        if last_n is not None:
-            pairs = pairs[-last_n:]
-
-        for idx, (white, black) in enumerate(pairs):
-            move_num = (len(pairs) - len(pairs) + idx + 1) if last_n else (idx + 1)
-            # Adjust move number when slicing
-            if last_n is not None:
-                move_num = len(game.move_history) // 2 - len(pairs) + idx + 1
+        for pair_idx in range(first, total_pairs):
+            white = history[2 * pair_idx]
+            black = history[2 * pair_idx + 1] if 2 * pair_idx + 1 < len(history) else None
+            move_num = pair_idx + 1
 
             white_text = self._styled_san(white)
             black_text = self._styled_san(black) if black else Text("...", style=self.STYLE_DIM)
@@ -299,33 +325,32 @@ class BoardDisplay:
         table.add_column("White", justify="center")
         table.add_column("Black", justify="center")
 
-        white_moves = [r for r in game.move_history if r.piece.color == Color.WHITE]
-        black_moves = [r for r in game.move_history if r.piece.color == Color.BLACK]
-
-        table.add_row(
-            "Moves",
-            str(len(white_moves)),
-            str(len(black_moves)),
-        )
-        table.add_row(
-            "Captures",
-            str(sum(1 for r in white_moves if r.captured_piece)),
-            str(sum(1 for r in black_moves if r.captured_piece)),
-        )
-        table.add_row(
-            "Checks",
-            str(sum(1 for r in white_moves if r.is_check)),
-            str(sum(1 for r in black_moves if r.is_check)),
-        )
+        # Tally per-side stats in a single walk over the move history
+        tallies: dict[Color, Counter[str]] = {Color.WHITE: Counter(), Color.BLACK: Counter()}
+        for r in game.move_history:
+            tally = tallies[r.piece.color]
+            tally["moves"] += 1
+            if r.captured_piece:
+                tally["captures"] += 1
+            if r.is_check:
+                tally["checks"] += 1
+            if r.is_castling:
+                tally["castled"] += 1
+            if r.is_promotion:
+                tally["promotions"] += 1
+        white, black = tallies[Color.WHITE], tallies[Color.BLACK]
+
+        for label, key in [("Moves", "moves"), ("Captures", "captures"), ("Checks", "checks")]:
+            table.add_row(label, str(white[key]), str(black[key]))
         table.add_row(
             "Castled",
-            "Yes" if any(r.is_castling for r in white_moves) else "No",
-            "Yes" if any(r.is_castling for r in black_moves) else "No",
+            "Yes" if white["castled"] else "No",
+            "Yes" if black["castled"] else "No",
         )
         table.add_row(
             "Promotions",
-            str(sum(1 for r in white_moves if r.is_promotion)),
-            str(sum(1 for r in black_moves if r.is_promotion)),
+            str(white["promotions"]),
+            str(black["promotions"]),
         )
 
         # Material remaining
@@ -347,9 +372,10 @@ class BoardDisplay:
     def _material_string(self, pieces: list) -> str:
         """Build a compact string showing remaining material."""
         symbols = []
+        counts = Counter(p.piece_type for p in pieces)
         for pt in [PieceType.QUEEN, PieceType.ROOK, PieceType.BISHOP,
                     PieceType.KNIGHT, PieceType.PAWN]:
-            count = sum(1 for p in pieces if p.piece_type == pt)
+            count = counts[pt]
             if count > 0:
                 sym = self.get_piece_symbol(
                     chess.Piece(pt.value, pieces[0].color.value)
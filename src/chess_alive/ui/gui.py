@@ -4,13 +4,14 @@ import tkinter as tk
 from tkinter import messagebox, scrolledtext
 import asyncio
 import threading
+from concurrent.futures import Future
 from typing import Optional, Callable
 import chess
 
 from ..core.game import ChessGame, MoveRecord
 from ..core.piece import Color
-from ..llm.client import LLMClient
-from ..llm.commentary import CommentaryEngine
+from ..llm.client import LLMClient, close_shared_clients, get_shared_client
+from ..llm.commentary import Commentary, CommentaryEngine
 from ..config import get_config
 
 
@@ -318,10 +319,16 @@ class ChessAliveGUI:
         self.game = ChessGame()
         self.llm_client: Optional[LLMClient] = None
         self.commentary_engine: Optional[CommentaryEngine] = None
+        # Background event loop that owns the LLM client's connections
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
         # Initialize LLM if configured
         if self.config.llm.is_configured:
-            self.llm_client = LLMClient(self.config.llm)
+            self._loop = asyncio.new_event_loop()
+            threading.Thread(target=self._loop.run_forever, daemon=True).start()
+            self.llm_client = asyncio.run_coroutine_threadsafe(
+                get_shared_client(self.config.llm), self._loop
+            ).result()
             self.commentary_engine = CommentaryEngine(self.llm_client, "every_move")
 
         self._create_ui()
@@ -375,27 +382,20 @@ class ChessAliveGUI:
         self.commentary_panel.add_move_info(record)
 
         # Generate commentary asynchronously
-        if self.commentary_engine:
-            thread = threading.Thread(
-                target=self._generate_commentary_thread,
-                args=(record,),
-                daemon=True,
+        if self.commentary_engine and self._loop:
+            future = asyncio.run_coroutine_threadsafe(
+                self.commentary_engine.generate_move_commentary(self.game, record),
+                self._loop,
             )
-            thread.start()
+            future.add_done_callback(lambda f: self._show_commentary(f, record))
         else:
             # Use fallback commentary
             self._add_fallback_commentary(record)
 
-    def _generate_commentary_thread(self, record: MoveRecord):
-        """Generate commentary in a background thread."""
+    def _show_commentary(self, future: Future[list[Commentary]], record: MoveRecord):
+        """Show finished commentary; runs on the background loop's thread."""
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            assert self.commentary_engine is not None
-            commentaries = loop.run_until_complete(
-                self.commentary_engine.generate_move_commentary(self.game, record)
-            )
-            loop.close()
+            commentaries = future.result()
 
             # Update UI from main thread
             for c in commentaries:
@@ -465,8 +465,9 @@ class ChessAliveGUI:
         self.root.mainloop()
 
         # Cleanup
-        if self.llm_client:
-            asyncio.run(self.llm_client.close())
+        if self._loop:
+            asyncio.run_coroutine_threadsafe(close_shared_clients(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
 
 
 def main():
@@ -21,6 +21,7 @@ from chess_alive.credentials import (
     _get_config_dir,
     _get_credentials_path,
 )
+from chess_alive.config import get_config, reload_config
 
 
 @pytest.fixture
@@ -35,6 +36,14 @@ def tmp_config_dir(tmp_path):
             yield config_dir
 
 
+@pytest.fixture
+def uncached_config():
+    """Start and end with an empty get_config cache so temp-dir configs don't leak."""
+    get_config.cache_clear()
+    yield
+    get_config.cache_clear()
+
+
 class TestObfuscation:
     """Test the obfuscation/deobfuscation round-trip."""
 
@@ -194,3 +203,24 @@ class TestConfigDir:
             with patch("chess_alive.credentials.platform.system", return_value="Linux"):
                 d = _get_config_dir()
                 assert d == Path.home() / ".config" / "chess-alive"
+
+
+class TestConfigReload:
+    """Tests for the cached game configuration."""
+
+    def test_config_cached_until_reload(self, tmp_config_dir, uncached_config, monkeypatch):
+        """get_config reuses one instance; reload_config picks up saved changes."""
+        for var in ("CHESS_LLM_PROVIDER", "OPENROUTER_API_KEY", "CHESS_LLM_MODEL"):
+            monkeypatch.delenv(var, raising=False)
+
+        config = reload_config()
+        assert get_config() is config
+        assert not config.llm.is_configured
+
+        save_api_key("sk-or-saved-key-1234567890", model="test/model")
+        assert get_config() is config
+
+        config = reload_config()
+        assert get_config() is config
+        assert config.llm.api_key == "sk-or-saved-key-1234567890"
+        assert config.llm.model == "test/model"
@@ -1,14 +1,21 @@
 """Tests for the new features: ModeConfig, JSON parsing, Rich display."""
 
+import subprocess
+import sys
+
 import pytest
 import chess
 from io import StringIO
+from unittest.mock import AsyncMock, patch
 from rich.console import Console
+from rich.text import Text
 
+from chess_alive.modes.match import MatchEvent
 from chess_alive.modes.mode import GameMode, ModeConfig
 from chess_alive.players.llm_player import LLMPlayer
 from chess_alive.core.game import ChessGame, GameResult
 from chess_alive.core.piece import Color
+from chess_alive.ui.cli import CLI
 from chess_alive.ui.display import BoardDisplay
 
 
@@ -146,6 +153,9 @@ class TestLLMPlayerJsonWithMock:
             async def complete(self, prompt, system_prompt=None, temperature=None, max_tokens=None):
                 return '{"move": "e4", "reasoning": "Control center"}'
 
+            async def complete_stream(self, prompt, system_prompt=None, temperature=None, max_tokens=None):
+                yield await self.complete(prompt, system_prompt, temperature, max_tokens)
+
         player = LLMPlayer(Color.WHITE)
         player.set_client(MockClient())
         game = ChessGame()
@@ -162,6 +172,9 @@ class TestLLMPlayerJsonWithMock:
             async def complete(self, prompt, system_prompt=None, temperature=None, max_tokens=None):
                 return '{"move": "e4", "reasoning": "Classical king pawn opening"}'
 
+            async def complete_stream(self, prompt, system_prompt=None, temperature=None, max_tokens=None):
+                yield await self.complete(prompt, system_prompt, temperature, max_tokens)
+
         player = LLMPlayer(Color.WHITE)
         player.set_client(MockClient())
         game = ChessGame()
@@ -178,6 +191,9 @@ class TestLLMPlayerJsonWithMock:
             async def complete(self, prompt, system_prompt=None, temperature=None, max_tokens=None):
                 return "I'll play MOVE: d4"
 
+            async def complete_stream(self, prompt, system_prompt=None, temperature=None, max_tokens=None):
+                yield await self.complete(prompt, system_prompt, temperature, max_tokens)
+
         player = LLMPlayer(Color.WHITE)
         player.set_client(MockClient())
         game = ChessGame()
@@ -247,6 +263,18 @@ class TestBoardDisplayMoveHistory:
         assert "Nf3" in output
         assert "..." in output  # Black's column shows "..."
 
+    def test_history_last_n_odd_number_of_moves(self):
+        """print_move_history with last_n keeps only the trailing rows."""
+        display, _, buf = self._make_display()
+        game = ChessGame()
+        self._play_moves(game, ["e4", "e5", "Nf3", "Nc6", "Bb5"])
+        display.print_move_history(game, last_n=1)
+        output = Text.from_ansi(buf.getvalue()).plain
+        assert "Nf3" not in output
+        # The remaining row keeps its real move number, not 1
+        row = next(line for line in output.splitlines() if "Bb5" in line)
+        assert row.split("│")[1].strip() == "3"
+
 
 class TestBoardDisplayGameStats:
     """Tests for game statistics table."""
@@ -314,6 +342,65 @@ class TestBoardDisplayPostGame:
         assert "Game Statistics" in output
 
 
+class TestBoardDisplayRender:
+    """Tests for the plain-text board rendering."""
+
+    def test_render_start_position_ascii(self):
+        """Pieces land on the right squares, White at the bottom."""
+        display = BoardDisplay(use_unicode=False)
+        lines = display.render_board(ChessGame()).splitlines()
+
+        assert lines[1] == "8 | r  n  b  q  k  b  n  r |"
+        assert lines[7] == "2 | P  P  P  P  P  P  P  P |"
+        assert lines[-1] == "    a  b  c  d  e  f  g  h"
+
+    def test_render_flipped_with_last_move(self):
+        """Flipped boards start at rank 1 and mark the last move."""
+        display = BoardDisplay(use_unicode=False)
+        game = ChessGame()
+        record = game.make_move_san("e4")
+        highlights = {chess.A1}
+
+        lines = display.render_board(
+            game, flip=True, highlight_squares=highlights, last_move=record.move
+        ).splitlines()
+
+        assert lines[1] == "1 | R  N  B  K  Q  B  N [R]|"
+        assert lines[2] == "2 | P  P  P [ ] P  P  P  P |"
+        assert lines[4] == "4 |         [P]            |"
+        assert lines[-1] == "    h  g  f  e  d  c  b  a"
+        # The caller's set is left alone
+        assert highlights == {chess.A1}
+
+    def test_render_reuses_frames(self):
+        """A repeated position is served from the frame cache."""
+        display = BoardDisplay(use_unicode=False)
+        game = ChessGame()
+
+        first = display.render_board(game)
+        assert display.render_board(game) is first
+
+        # Same placement reached again (knights out and back)
+        for san in ("Nf3", "Nf6", "Ng1", "Ng8"):
+            game.make_move_san(san)
+        assert display.render_board(game) is first
+
+        # Different highlights or orientation are separate frames
+        assert display.render_board(game, last_move=game.move_history[-1].move) != first
+        assert display.render_board(game, flip=True) != first
+
+    def test_frame_cache_bounded(self):
+        """The frame cache never grows past its size limit."""
+        display = BoardDisplay(use_unicode=False)
+        display.FRAME_CACHE_SIZE = 4
+        game = ChessGame()
+
+        for square in range(10):
+            display.render_board(game, highlight_squares={square})
+
+        assert len(display._frames) == 4
+
+
 class TestStyledSan:
     """Tests for styled SAN move text."""
 
@@ -337,3 +424,133 @@ class TestStyledSan:
         record = game.move_history[0]
         text = display._styled_san(record)
         assert text.plain == "e4"
+
+
+# =============================================================================
+# UI package import tests
+# =============================================================================
+
+class TestUIPackageImport:
+    """Tests for the ui package's deferred GUI import."""
+
+    def test_cli_import_does_not_load_gui(self):
+        """Importing the CLI leaves tkinter unloaded until the GUI is asked for."""
+        code = (
+            "import sys, chess_alive.ui\n"
+            "assert 'chess_alive.ui.gui' not in sys.modules\n"
+            "assert 'tkinter' not in sys.modules\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+
+    def test_gui_available_on_access(self):
+        """ChessAliveGUI is still importable from the ui package."""
+        pytest.importorskip("tkinter")
+        from chess_alive.ui import ChessAliveGUI
+        from chess_alive.ui.gui import ChessAliveGUI as direct
+
+        assert ChessAliveGUI is direct
+
+
+# =============================================================================
+# CLI menu tests
+# =============================================================================
+
+@pytest.fixture
+def cli_output():
+    """Buffer that the CLI fixture's console writes to."""
+    return StringIO()
+
+
+@pytest.fixture
+def cli(cli_output):
+    """CLI printing to an in-memory console."""
+    return CLI(Console(file=cli_output, width=120))
+
+
+class TestCLIMenu:
+    """Tests for the CLI's static menu output."""
+
+    def test_banner_panel_reused(self, cli, cli_output):
+        """The banner is wrapped once and printed verbatim."""
+        cli.print_banner()
+        panel = cli._banner_panel
+        cli.print_banner()
+
+        assert cli._banner_panel is panel
+        assert "Where every piece has a voice!" in cli_output.getvalue()
+        assert "|____| | | |  __/" in cli_output.getvalue()
+
+    def test_menu_table_reused(self, cli, cli_output):
+        """The mode table is built once and prints the same every time."""
+        cli.print_menu()
+        first = cli_output.getvalue()
+        table = cli._menu_table
+        cli.print_menu()
+
+        assert cli._menu_table is table
+        assert cli_output.getvalue() == first * 2
+        assert all(name in first for _, name, _ in CLI.MENU_MODES)
+
+    @pytest.mark.asyncio
+    async def test_human_input_prompts_for_side_to_move(self, cli):
+        """Human input is read via Prompt.ask for the side to move."""
+        game = ChessGame()
+        game.make_move_san("e4")
+
+        with patch("chess_alive.ui.cli.Prompt.ask", return_value="e5") as mock_ask:
+            assert await cli.human_input_handler(game) == "e5"
+
+        assert "Black's move" in mock_ask.call_args.args[0]
+
+    @pytest.mark.asyncio
+    async def test_game_events_single_write(self, cli, cli_output):
+        """Game start and end events each go out in one console print."""
+        with patch.object(cli.console, "print", wraps=cli.console.print) as mock_print:
+            await cli.handle_event(MatchEvent("game_start", {"white": "Alice", "black": "Bob"}))
+            await cli.handle_event(MatchEvent("game_end", {"result": "1-0", "moves": 3}))
+
+        assert mock_print.call_count == 2
+        assert cli_output.getvalue() == (
+            "\nGame started!\nWhite: Alice\nBlack: Bob\n\n"
+            "\nGame Over!\nResult: 1-0\nTotal moves: 3\n"
+        )
+
+    @pytest.mark.asyncio
+    async def test_select_mode_choices(self, cli):
+        """Menu numbers map to modes and both quit spellings exit."""
+        with patch("chess_alive.ui.cli.Prompt.ask", side_effect=["7", "q", "quit"]) as mock_ask:
+            assert await cli.select_mode() == GameMode.TEACHING
+            assert await cli.select_mode() is None
+            assert await cli.select_mode() is None
+
+        assert mock_ask.call_args.kwargs["choices"] == CLI.MENU_CHOICES
+        assert CLI.QUIT_CHOICES <= set(CLI.MENU_CHOICES)
+
+    def test_setup_llm_dispatch(self, cli):
+        """Setup actions route to their handlers; 'back' does nothing."""
+        with patch("chess_alive.ui.cli.Prompt.ask", side_effect=["clear", "back"]), \
+                patch.object(cli, "_clear_config") as mock_clear, \
+                patch.object(cli, "_setup_ollama") as mock_ollama:
+            cli._setup_llm()
+            cli._setup_llm()
+
+        mock_clear.assert_called_once_with()
+        mock_ollama.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_human_input_retry_skips_redraw(self, cli):
+        """Re-prompting in the same position doesn't redraw the board or re-run advice."""
+        cli._pre_move_advisor = AsyncMock(side_effect=RuntimeError("offline"))
+        game = ChessGame()
+
+        with patch("chess_alive.ui.cli.Prompt.ask", return_value="e4"), \
+                patch.object(cli.display, "print_board") as mock_board:
+            await cli.human_input_handler(game)
+            await cli.human_input_handler(game)
+            assert mock_board.call_count == 1
+            assert cli._pre_move_advisor.await_count == 1
+
+            game.make_move_san("e4")
+            await cli.human_input_handler(game)
+            assert mock_board.call_count == 2
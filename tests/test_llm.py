@@ -1,10 +1,19 @@
 """Tests for LLM client and commentary."""
 
+import asyncio
+import threading
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
 
-from chess_alive.llm.client import LLMClient, LLMResponse, LLMError
+from chess_alive.llm.client import (
+    LLMClient,
+    LLMResponse,
+    LLMError,
+    get_shared_client,
+    close_shared_clients,
+)
 from chess_alive.llm.commentary import (
     CommentaryEngine,
     PieceVoice,
@@ -126,6 +135,22 @@ class TestLLMClient:
             assert response.content == "Test response"
             assert response.total_tokens == 15
 
+    @pytest.mark.asyncio
+    async def test_complete_stream_reports_provider_error(self):
+        """Test a 4xx on the streaming path surfaces the provider's message."""
+        client = LLMClient(LLMConfig(api_key="bad-key"))
+
+        def handler(request):
+            return httpx.Response(401, json={"error": {"message": "Invalid API key"}})
+
+        async with httpx.AsyncClient(
+            base_url="https://example.test", transport=httpx.MockTransport(handler)
+        ) as http:
+            with patch.object(client, "_get_client", new=AsyncMock(return_value=http)):
+                with pytest.raises(LLMError, match="Invalid API key"):
+                    async for _ in client.complete_stream("Hello"):
+                        pass
+
     @pytest.mark.asyncio
     async def test_close(self):
         """Test closing the client."""
@@ -135,6 +160,51 @@ class TestLLMClient:
         # Should not raise even if no client created
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_http_client_from_other_loop_closed_there(self):
+        """Test a client bound to another event loop is closed on that loop and rebuilt."""
+        client = LLMClient(LLMConfig(api_key="test-key"))
+        other_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            first = await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(client._get_client(), other_loop)
+            )
+            second = await client._get_client()
+
+            assert first is not second
+            assert first.is_closed
+            assert client._loop is asyncio.get_running_loop()
+        finally:
+            await client.close()
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            thread.join()
+            other_loop.close()
+
+    @pytest.mark.asyncio
+    async def test_shared_client_reused_per_config(self):
+        """Test matches with the same config share one client."""
+        config = LLMConfig(api_key="test-key")
+
+        client = await get_shared_client(config)
+        assert await get_shared_client(LLMConfig(api_key="test-key")) is client
+
+        # Editing the original config must not leak into the shared client,
+        # and the superseded client is closed rather than kept around
+        config.api_key = "other-key"
+        with patch.object(client, "close", new=AsyncMock()) as mock_close:
+            other = await get_shared_client(config)
+        assert other is not client
+        assert client.config.api_key == "test-key"
+        mock_close.assert_awaited_once()
+
+        with patch.object(other, "close", new=AsyncMock()) as mock_close:
+            await close_shared_clients()
+        mock_close.assert_awaited_once()
+        assert await get_shared_client(config) is not other
+        await close_shared_clients()
+
 
 class TestPieceVoice:
     """Tests for PieceVoice."""
@@ -165,6 +235,19 @@ class TestPieceVoice:
         assert "white" in prompt.lower()
         assert "Sir Galahad" in prompt
 
+    def test_system_prompt_cached_per_personality(self):
+        """Test system prompt is reused until the personality is replaced."""
+        piece = Piece(PieceType.KNIGHT, Color.WHITE, personality=PiecePersonality(name="Percival"))
+        voice = PieceVoice(piece, MagicMock())
+
+        first = voice._get_system_prompt()
+        assert voice._get_system_prompt() is first
+
+        piece.personality = PiecePersonality(name="Lancelot")
+        prompt = voice._get_system_prompt()
+        assert "Lancelot" in prompt
+        assert "Percival" not in prompt
+
     def test_fallback_commentary_capture(self):
         """Test fallback commentary for captures."""
         personality = PiecePersonality(aggression=8)
@@ -245,6 +328,38 @@ class TestCommentaryEngine:
         record = game.make_move_san("exd5")
         assert engine.should_generate_commentary(record)
 
+    @pytest.mark.asyncio
+    async def test_move_commentary_capture_order(self):
+        """Test capture commentary keeps mover first, then captured piece."""
+        mock_client = MagicMock()
+        mock_client.complete = AsyncMock(side_effect=["Mine!", "Alas!"])
+        engine = CommentaryEngine(mock_client, "every_move")
+
+        game = ChessGame()
+        game.make_move_san("e4")
+        game.make_move_san("d5")
+        record = game.make_move_san("exd5")
+
+        commentaries = await engine.generate_move_commentary(game, record)
+
+        assert [c.commentary_type for c in commentaries] == ["move", "capture"]
+        assert [c.text for c in commentaries] == ["Mine!", "Alas!"]
+        assert commentaries[1].piece == record.captured_piece
+
+    @pytest.mark.asyncio
+    async def test_game_start_commentary_both_kings(self):
+        """Test both kings give an opening statement, White first."""
+        mock_client = MagicMock()
+        mock_client.complete = AsyncMock(side_effect=["For White!", "For Black!"])
+        engine = CommentaryEngine(mock_client)
+
+        commentaries = await engine.generate_game_start_commentary(ChessGame())
+
+        assert [c.piece.color for c in commentaries] == [Color.WHITE, Color.BLACK]
+        assert all(c.piece.piece_type == PieceType.KING for c in commentaries)
+        assert all(c.commentary_type == "game_start" for c in commentaries)
+        assert [c.text for c in commentaries] == ["For White!", "For Black!"]
+
 
 class TestCommentary:
     """Tests for Commentary dataclass."""
@@ -1,5 +1,7 @@
 """Tests for match orchestration."""
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -261,3 +263,50 @@ class TestMatchSetup:
             assert match is not None
 
         # Should be cleaned up
+
+
+class TestMatchRunStartup:
+    """Tests for player startup in Match.run."""
+
+    @pytest.mark.asyncio
+    async def test_run_starts_players_concurrently(self):
+        """Test both players' on_game_start run in parallel."""
+        started: list[str] = []
+        release = asyncio.Event()
+
+        class SlowStartPlayer(MockPlayer):
+            async def on_game_start(self, game):
+                started.append(self.name)
+                if len(started) == 2:
+                    release.set()
+                # Would deadlock if starts were awaited one after another
+                await asyncio.wait_for(release.wait(), timeout=1.0)
+                self.game_started = True
+
+        match = Match(MatchConfig(enable_commentary=False))
+        match.white_player = SlowStartPlayer(Color.WHITE, [])
+        match.black_player = SlowStartPlayer(Color.BLACK, [])
+
+        await match.run()
+
+        assert match.white_player.game_started
+        assert match.black_player.game_started
+
+    @pytest.mark.asyncio
+    async def test_failed_start_still_ends_both_players(self):
+        """Test a player failing to start does not leave the other's engine out."""
+
+        class BrokenStartPlayer(MockPlayer):
+            async def on_game_start(self, game):
+                raise RuntimeError("Failed to start Stockfish")
+
+        match = Match(MatchConfig(enable_commentary=False))
+        match.white_player = BrokenStartPlayer(Color.WHITE, [])
+        match.black_player = MockPlayer(Color.BLACK, [])
+
+        with pytest.raises(RuntimeError, match="Failed to start"):
+            await match.run()
+
+        assert match.black_player.game_started
+        assert match.white_player.game_ended
+        assert match.black_player.game_ended
@@ -2,7 +2,7 @@
 
 import pytest
 
-from chess_alive.modes.mode import GameMode
+from chess_alive.modes.mode import GameMode, ModeConfig
 from chess_alive.players.base import PlayerType
 
 
@@ -130,3 +130,31 @@ class TestGameMode:
         assert all(isinstance(m, tuple) for m in all_modes)
         assert all(isinstance(m[0], GameMode) for m in all_modes)
         assert all(isinstance(m[1], str) for m in all_modes)
+
+    def test_description_and_defaults_precomputed(self):
+        """Test description/defaults are plain per-member attributes with the right values."""
+        expected = {
+            GameMode.PLAYER_VS_PLAYER: ("Two human players", "key_moments", 500),
+            GameMode.PLAYER_VS_COMPUTER: (
+                "Human vs Stockfish chess engine", "key_moments", 500,
+            ),
+            GameMode.COMPUTER_VS_COMPUTER: ("Stockfish vs Stockfish", "captures_only", 300),
+            GameMode.PLAYER_VS_LLM: ("Human vs LLM-controlled player", "every_move", 500),
+            GameMode.LLM_VS_LLM: ("LLM vs LLM", "key_moments", 200),
+            GameMode.LLM_VS_COMPUTER: ("LLM vs Stockfish chess engine", "key_moments", 500),
+            GameMode.TEACHING: (
+                "Teaching mode — Human vs Stockfish with LLM coaching", "key_moments", 500,
+            ),
+        }
+        assert set(expected) == set(GameMode)
+
+        for name in ("description", "defaults"):
+            assert not isinstance(vars(GameMode).get(name), property)
+
+        for mode, (description, frequency, max_moves) in expected.items():
+            assert "description" in vars(mode)
+            assert "defaults" in vars(mode)
+            assert mode.description == description
+            assert isinstance(mode.defaults, ModeConfig)
+            assert mode.defaults.commentary_frequency == frequency
+            assert mode.defaults.max_moves == max_moves
@@ -45,6 +45,19 @@ class _MockOllamaHandler(BaseHTTPRequestHandler):
         idx = _MockOllamaHandler.move_counter % len(self.SCRIPTED_MOVES)
         move = self.SCRIPTED_MOVES[idx]
         _MockOllamaHandler.move_counter += 1
+        content = json.dumps({"move": move, "reasoning": f"Playing {move}"})
+
+        if data.get("stream"):
+            # Server-sent events, split mid-object like a real token stream
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.end_headers()
+            half = len(content) // 2
+            for piece in (content[:half], content[half:]):
+                chunk = {"choices": [{"index": 0, "delta": {"content": piece}}]}
+                self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+            self.wfile.write(b"data: [DONE]\n\n")
+            return
 
         response = {
             "id": "mock-001",
@@ -54,7 +67,7 @@ class _MockOllamaHandler(BaseHTTPRequestHandler):
                 "index": 0,
                 "message": {
                     "role": "assistant",
-                    "content": json.dumps({"move": move, "reasoning": f"Playing {move}"}),
+                    "content": content,
                 },
                 "finish_reason": "stop",
             }],
@@ -268,6 +281,8 @@ class TestLLMPlayerWithOllama:
 
             assert move is not None
             assert game.is_legal_move(move)
+            # The scripted reply, not the random fallback
+            assert move == game.parse_move("e4")
 
     @pytest.mark.asyncio
     async def test_json_parsing_from_ollama(self, mock_ollama_server):
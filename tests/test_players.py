@@ -1,14 +1,21 @@
 """Tests for player implementations."""
 
+import gc
+
 import pytest
 import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 import chess
+import chess.engine
 
 from chess_alive.core.game import ChessGame
 from chess_alive.core.piece import Color
 from chess_alive.players.base import Player, PlayerType
 from chess_alive.players.human import HumanPlayer
 from chess_alive.players.llm_player import LLMPlayer
+import chess_alive.players.computer as computer
+from chess_alive.players.computer import ComputerPlayer, EnginePool, find_stockfish
+from chess_alive.config import EngineConfig
 
 
 class TestPlayerBase:
@@ -53,6 +60,35 @@ class TestHumanPlayer:
         assert move.from_square == chess.E2
         assert move.to_square == chess.E4
 
+    @pytest.mark.asyncio
+    async def test_human_player_reads_stdin(self):
+        """Test default input reads from stdin and strips whitespace."""
+        game = ChessGame()
+        player = HumanPlayer(Color.WHITE, "Alice")
+
+        with patch("builtins.input", return_value="  e4 \n") as mock_input:
+            move = await player.get_move(game)
+
+        assert move == game.parse_move("e4")
+        mock_input.assert_called_once_with("Alice's move: ")
+
+    @pytest.mark.asyncio
+    async def test_human_player_commands_case_insensitive(self, capsys):
+        """Test commands are recognised regardless of case."""
+        game = ChessGame()
+        inputs = iter(["MOVES", "Help", "Resign"])
+
+        async def mock_handler(g):
+            return next(inputs)
+
+        player = HumanPlayer(Color.WHITE, input_handler=mock_handler)
+        move = await player.get_move(game)
+
+        assert move is None
+        out = capsys.readouterr().out
+        assert "Legal moves (20)" in out
+        assert "Commands:" in out
+
     @pytest.mark.asyncio
     async def test_human_player_wrong_turn(self):
         """Test human player returns None when not their turn."""
@@ -90,6 +126,44 @@ class TestLLMPlayer:
         assert defensive.style == "defensive"
         assert creative.style == "creative"
 
+    def test_llm_player_move_prompt_uses_fen(self):
+        """Test the move prompt carries the FEN rather than an ASCII board."""
+        player = LLMPlayer(Color.WHITE)
+        game = ChessGame()
+
+        prompt = player._build_move_prompt(game)
+
+        assert f"FEN: {game.fen}" in prompt
+        assert str(game.board) not in prompt
+        assert "FEN" in player._get_system_prompt()
+
+    def test_llm_player_move_prompt_history_numbering(self):
+        """Test recent moves are numbered from the start of the game."""
+        player = LLMPlayer(Color.BLACK)
+        game = ChessGame()
+        for san in ("e4", "e5", "Nf3"):
+            game.make_move_san(san)
+
+        assert "Move history: 1. e4 e5 2. Nf3" in player._build_move_prompt(game)
+
+        for san in ("Nc6", "Bb5", "a6", "Ba4", "Nf6", "O-O", "Be7", "Re1", "b5"):
+            game.make_move_san(san)
+
+        assert "Move history: 2. Nf3 Nc6 3. Bb5 a6 4. Ba4 Nf6 5. O-O Be7 6. Re1 b5" in (
+            player._build_move_prompt(game)
+        )
+
+    def test_llm_player_system_prompt_cached(self):
+        """Test system prompt is reused and follows style changes."""
+        player = LLMPlayer(Color.WHITE, style="aggressive")
+
+        prompt = player._get_system_prompt()
+        assert player._get_system_prompt() is prompt
+        assert "attacking" in prompt
+
+        player.style = "defensive"
+        assert "solid" in player._get_system_prompt()
+
     def test_llm_player_parse_move_from_response(self):
         """Test parsing move from LLM response."""
         player = LLMPlayer(Color.WHITE)
@@ -119,6 +193,14 @@ class TestLLMPlayer:
         move = player._fallback_move_extraction(response, game)
         assert move is not None
 
+    def test_llm_player_fallback_prefers_first_mention(self):
+        """Test fallback returns the legal move mentioned first in the text."""
+        player = LLMPlayer(Color.WHITE)
+        game = ChessGame()
+
+        move = player._fallback_move_extraction("Nf3 is fine, but e4 is sharper.", game)
+        assert move == game.parse_move("Nf3")
+
     def test_llm_player_fallback_uci(self):
         """Test fallback extraction with UCI format."""
         player = LLMPlayer(Color.WHITE)
@@ -128,6 +210,33 @@ class TestLLMPlayer:
         move = player._fallback_move_extraction(response, game)
         assert move is not None
 
+    def test_llm_player_legal_san_cached_per_position(self):
+        """Test legal SAN list is reused for a position and refreshed after a move."""
+        player = LLMPlayer(Color.WHITE)
+        game = ChessGame()
+
+        legal = player._legal_san(game)
+        assert player._legal_san(game) is legal
+        assert len(legal) == 20
+
+        game.make_move_san("e4")
+        assert "e5" in player._legal_san(game)
+
+    def test_llm_player_san_pattern_cached_per_position(self):
+        """Test the fallback SAN regex is compiled once per position."""
+        player = LLMPlayer(Color.WHITE)
+        game = ChessGame()
+        game.load_fen("6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1")
+
+        pattern = player._legal_san_pattern(game)
+        assert player._legal_san_pattern(game) is pattern
+        assert player._fallback_move_extraction("Finish with Ra8#", game) == (
+            game.parse_move("Ra8#")
+        )
+
+        game.make_move_san("Kf1")
+        assert player._legal_san_pattern(game) is not pattern
+
     @pytest.mark.asyncio
     async def test_llm_player_no_client_error(self):
         """Test LLM player raises error without client."""
@@ -153,6 +262,28 @@ class MockLLMClient:
         })
         return self.response
 
+    async def complete_stream(self, prompt, system_prompt=None, temperature=None, max_tokens=None):
+        yield await self.complete(prompt, system_prompt, temperature, max_tokens)
+
+
+class MockStreamingLLMClient(MockLLMClient):
+    """Mock LLM client that streams its response in chunks."""
+
+    def __init__(self, chunks: list[str]):
+        super().__init__("".join(chunks))
+        self.chunks = chunks
+        self.streamed = 0
+
+    async def complete_stream(self, prompt, system_prompt=None, temperature=None, max_tokens=None):
+        self.calls.append({
+            "prompt": prompt,
+            "system_prompt": system_prompt,
+            "temperature": temperature,
+        })
+        for chunk in self.chunks:
+            self.streamed += 1
+            yield chunk
+
 
 class TestLLMPlayerWithMock:
     """Tests for LLMPlayer with mock client."""
@@ -186,6 +317,149 @@ class TestLLMPlayerWithMock:
         assert move is not None
         assert game.is_legal_move(move)
 
+    @pytest.mark.asyncio
+    async def test_llm_player_stops_stream_at_json_move(self):
+        """Test the stream is abandoned once a legal JSON move arrives."""
+        player = LLMPlayer(Color.WHITE)
+        game = ChessGame()
+
+        mock_client = MockStreamingLLMClient([
+            '{"move": ', '"e4", "reasoning": "center"}', " More thoughts", " and more",
+        ])
+        player.set_client(mock_client)
+
+        move = await player.get_move(game)
+
+        assert move == game.parse_move("e4")
+        assert mock_client.streamed == 2
+
+    @pytest.mark.asyncio
+    async def test_llm_player_stream_falls_back_to_text(self):
+        """Test a fully streamed text response still goes through the text parsers."""
+        player = LLMPlayer(Color.WHITE)
+        game = ChessGame()
+
+        mock_client = MockStreamingLLMClient(["REASONING: space\n", "MOVE: ", "d4"])
+        player.set_client(mock_client)
+
+        move = await player.get_move(game)
+
+        assert move == game.parse_move("d4")
+        assert mock_client.streamed == 3
+
+    @pytest.mark.asyncio
+    async def test_llm_player_forced_move_skips_llm(self):
+        """Test a position with one legal move is answered without the LLM."""
+        player = LLMPlayer(Color.BLACK)
+        game = ChessGame()
+        game.load_fen("7k/8/8/8/8/8/8/K5R1 b - - 0 1")
+        forced = chess.Move.from_uci("h8h7")
+
+        mock_client = MockLLMClient("MOVE: Kg7")
+        player.set_client(mock_client)
+
+        await player.on_opponent_move(game, chess.Move.from_uci("g2g1"))
+        assert await player.get_move(game) == forced
+        assert await player.get_move_with_reasoning(game) == (forced, "Forced move.")
+        assert mock_client.calls == []
+
+    @pytest.mark.asyncio
+    async def test_llm_player_prefetches_on_opponent_move(self):
+        """Test the request started on the opponent's move is reused."""
+        player = LLMPlayer(Color.BLACK)
+        game = ChessGame()
+        move = game.parse_move("e4")
+        game.make_move(move)
+
+        mock_client = MockLLMClient("MOVE: e5")
+        player.set_client(mock_client)
+
+        await player.on_opponent_move(game, move)
+        reply = await player.get_move(game)
+
+        assert reply == game.parse_move("e5")
+        assert len(mock_client.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_llm_player_discards_stale_prefetch(self):
+        """Test a prefetch for a different position is not used."""
+        player = LLMPlayer(Color.BLACK)
+        game = ChessGame()
+        move = game.parse_move("e4")
+        game.make_move(move)
+
+        mock_client = MockLLMClient("MOVE: e5")
+        player.set_client(mock_client)
+
+        await player.on_opponent_move(game, move)
+        game.undo_move()
+        game.make_move_san("d4")
+        await player.get_move(game)
+
+        assert "d4" in mock_client.calls[-1]["prompt"]
+
+    @pytest.mark.asyncio
+    async def test_llm_player_failed_prefetch_discarded_quietly(self):
+        """Test a prefetch that fails while being cancelled does not log an unretrieved error."""
+
+        class BrokenStreamLLMClient(MockLLMClient):
+            async def complete_stream(self, prompt, system_prompt=None, temperature=None,
+                                      max_tokens=None):
+                try:
+                    await asyncio.Event().wait()
+                    yield ""
+                finally:
+                    raise RuntimeError("connection dropped")
+
+        player = LLMPlayer(Color.BLACK)
+        game = ChessGame()
+        move = game.parse_move("e4")
+        game.make_move(move)
+        player.set_client(BrokenStreamLLMClient(""))
+
+        loop = asyncio.get_running_loop()
+        errors = []
+        loop.set_exception_handler(lambda _, context: errors.append(context))
+        try:
+            await player.on_opponent_move(game, move)
+            task = player._pending[1]
+            await asyncio.sleep(0)
+            await player.on_game_end(game)
+            await asyncio.wait([task])
+            del task
+            gc.collect()
+            await asyncio.sleep(0)
+        finally:
+            loop.set_exception_handler(None)
+
+        assert errors == []
+
+    @pytest.mark.asyncio
+    async def test_llm_player_reasoning_cancels_prefetch(self):
+        """Test get_move_with_reasoning does not leave a prefetch running."""
+        player = LLMPlayer(Color.BLACK)
+        game = ChessGame()
+        move = game.parse_move("e4")
+        game.make_move(move)
+
+        class StalledLLMClient(MockLLMClient):
+            async def complete_stream(self, prompt, system_prompt=None, temperature=None,
+                                      max_tokens=None):
+                await asyncio.Event().wait()
+                yield ""
+
+        player.set_client(StalledLLMClient('{"move": "e5", "reasoning": "Mirror"}'))
+
+        await player.on_opponent_move(game, move)
+        task = player._pending[1]
+        reply, reasoning = await player.get_move_with_reasoning(game)
+        await asyncio.wait([task], timeout=1.0)
+
+        assert reply == game.parse_move("e5")
+        assert reasoning == "Mirror"
+        assert player._pending is None
+        assert task.cancelled()
+
     @pytest.mark.asyncio
     async def test_llm_player_get_move_with_reasoning(self):
         """Test getting move with reasoning."""
@@ -199,3 +473,218 @@ class TestLLMPlayerWithMock:
 
         assert move is not None
         assert "center" in reasoning.lower()
+
+
+def _mock_engine():
+    """Create a mock UCI engine protocol."""
+    engine = MagicMock()
+    engine.configure = AsyncMock()
+    engine.ping = AsyncMock()
+    engine.quit = AsyncMock()
+    return engine
+
+
+class TestEnginePool:
+    """Tests for the shared Stockfish engine pool."""
+
+    @pytest.mark.asyncio
+    async def test_released_engine_is_reused(self):
+        """Test a released engine is handed out again instead of respawned."""
+        pool = EnginePool()
+        config = EngineConfig(path="/fake/stockfish")
+        engine = _mock_engine()
+
+        with patch("chess.engine.popen_uci", new=AsyncMock(
+            return_value=(MagicMock(), engine)
+        )) as popen:
+            first = await pool.acquire(config)
+            await pool.release(first, config)
+            second = await pool.acquire(config)
+
+        assert first is second is engine
+        popen.assert_awaited_once()
+        engine.quit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_dead_engine_is_replaced(self):
+        """Test an idle engine that no longer responds is discarded."""
+        pool = EnginePool()
+        config = EngineConfig(path="/fake/stockfish")
+        dead, fresh = _mock_engine(), _mock_engine()
+        dead.ping = AsyncMock(side_effect=chess.engine.EngineTerminatedError())
+
+        with patch("chess.engine.popen_uci", new=AsyncMock(
+            side_effect=[(MagicMock(), dead), (MagicMock(), fresh)]
+        )):
+            await pool.release(await pool.acquire(config), config)
+            engine = await pool.acquire(config)
+
+        assert engine is fresh
+
+    @pytest.mark.asyncio
+    async def test_computer_player_returns_engine_to_pool(self):
+        """Test game end hands the engine back and shutdown quits it."""
+        pool = EnginePool()
+        engine = _mock_engine()
+        player = ComputerPlayer(
+            Color.WHITE, config=EngineConfig(path="/fake/stockfish"), pool=pool
+        )
+        game = ChessGame()
+
+        with patch("chess.engine.popen_uci", new=AsyncMock(
+            return_value=(MagicMock(), engine)
+        )):
+            await player.on_game_start(game)
+            await player.on_game_end(game)
+
+        engine.quit.assert_not_awaited()
+        await pool.shutdown()
+        engine.quit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_shutdown_quits_checked_out_engines(self):
+        """Test shutdown also quits engines that were never released."""
+        pool = EnginePool()
+        config = EngineConfig(path="/fake/stockfish")
+        engine = _mock_engine()
+
+        with patch("chess.engine.popen_uci", new=AsyncMock(
+            return_value=(MagicMock(), engine)
+        )):
+            await pool.acquire(config)
+
+        await pool.shutdown()
+        engine.quit.assert_awaited_once()
+
+        # A late release after shutdown does not pool or quit it again
+        await pool.release(engine, config)
+        engine.quit.assert_awaited_once()
+        assert not any(pool._idle.values())
+
+    @pytest.mark.asyncio
+    async def test_engines_from_previous_loop_are_killed(self):
+        """Test idle engines are terminated when another event loop takes over."""
+        pool = EnginePool()
+        config = EngineConfig(path="/fake/stockfish")
+        stale, fresh = _mock_engine(), _mock_engine()
+
+        with patch("chess.engine.popen_uci", new=AsyncMock(
+            side_effect=[(MagicMock(), stale), (MagicMock(), fresh)]
+        )):
+            await pool.release(await pool.acquire(config), config)
+            pool._loop = object()  # As if a previous asyncio.run() owned the pool
+            engine = await pool.acquire(config)
+
+        assert engine is fresh
+        stale.transport.kill.assert_called_once()
+        stale.quit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_acquire_requires_path(self):
+        """Test the pool refuses to start an engine without a path."""
+        with pytest.raises(RuntimeError, match="not configured"):
+            await EnginePool().acquire(EngineConfig(path=None))
+
+    @pytest.mark.asyncio
+    async def test_engine_killed_if_configure_fails(self):
+        """Test a freshly started engine is not orphaned when setup fails."""
+        pool = EnginePool()
+        config = EngineConfig(path="/fake/stockfish")
+        engine = _mock_engine()
+        engine.configure = AsyncMock(side_effect=chess.engine.EngineError("bad option"))
+
+        with patch("chess.engine.popen_uci", new=AsyncMock(
+            return_value=(MagicMock(), engine)
+        )):
+            with pytest.raises(chess.engine.EngineError):
+                await pool.acquire(config)
+
+        engine.transport.kill.assert_called_once()
+        assert pool._checked_out == {}
+
+    @pytest.mark.asyncio
+    async def test_crashed_engine_discarded_from_pool(self):
+        """Test a player whose engine dies hands it back for discarding."""
+        pool = EnginePool()
+        engine = _mock_engine()
+        engine.play = AsyncMock(side_effect=chess.engine.EngineTerminatedError())
+        player = ComputerPlayer(
+            Color.WHITE, config=EngineConfig(path="/fake/stockfish"), pool=pool
+        )
+
+        with patch("chess.engine.popen_uci", new=AsyncMock(
+            return_value=(MagicMock(), engine)
+        )):
+            assert await player.get_move(ChessGame()) is None
+
+        assert pool._checked_out == {}
+        engine.transport.kill.assert_called_once()
+        await pool.shutdown()
+        engine.quit.assert_not_awaited()
+
+
+class TestComputerPlayer:
+    """Tests for ComputerPlayer's per-move engine settings."""
+
+    @pytest.mark.asyncio
+    async def test_computer_player_reuses_limit_and_syncs_skill(self):
+        """Test the search limit is reused until a setter changes it."""
+        engine = _mock_engine()
+        engine.play = AsyncMock(return_value=MagicMock(move=chess.Move.from_uci("e2e4")))
+        player = ComputerPlayer(Color.WHITE, config=EngineConfig(path="/fake/stockfish"))
+        player._engine = engine
+        player._engine_skill = player.config.skill_level
+        game = ChessGame()
+
+        await player.get_move(game)
+        await player.get_move(game)
+        first, second = (call.args[1] for call in engine.play.await_args_list)
+        assert first is second
+        engine.configure.assert_not_awaited()
+
+        player.set_depth(5)
+        player.set_skill_level(3)
+        await player.get_move(game)
+
+        assert engine.play.await_args.args[1].depth == 5
+        engine.configure.assert_awaited_once_with({"Skill Level": 3})
+
+    @pytest.mark.asyncio
+    async def test_shared_config_change_reaches_both_players(self):
+        """Test a setter on one player updates the other's search limit too."""
+        config = EngineConfig(path="/fake/stockfish")
+        white = ComputerPlayer(Color.WHITE, config=config)
+        black = ComputerPlayer(Color.BLACK, config=config)
+        engine = _mock_engine()
+        engine.play = AsyncMock(return_value=MagicMock(move=chess.Move.from_uci("e7e5")))
+        black._engine = engine
+        black._engine_skill = config.skill_level
+        game = ChessGame()
+        game.make_move_san("e4")
+
+        await black.get_move(game)
+        white.set_depth(4)
+        white.set_time_limit(0.5)
+        await black.get_move(game)
+
+        limit = engine.play.await_args.args[1]
+        assert (limit.depth, limit.time) == (4, 0.5)
+
+
+class TestFindStockfish:
+    """Tests for locating the Stockfish executable."""
+
+    @pytest.mark.asyncio
+    async def test_find_stockfish_prefers_path_and_caches(self):
+        """Test PATH hits win over known locations and are remembered."""
+
+        def which(name):
+            return "/path/stockfish" if name == "stockfish_15" else None
+
+        with patch.object(computer, "_stockfish_path", None), \
+                patch("shutil.which", side_effect=which) as mock_which, \
+                patch("os.path.isfile", return_value=True):
+            assert await find_stockfish() == "/path/stockfish"
+            calls = mock_which.call_count
+            assert await find_stockfish() == "/path/stockfish"
+            assert mock_which.call_count == calls